@@ -4,12 +4,15 @@ import psutil
 import time
 import os
 import subprocess
+import threading
 from smbus2 import SMBus
 
 class DataCollector:
     """Class responsible for collecting various system information"""
 
     def __init__(self):
+        # Guards replacing self.data; readers see either the old or the new dict, never a mix
+        self.lock = threading.RLock()
         self.data = {
             'ip_address': 'Loading...',
             'wifi_ssid': 'Loading...',
@@ -121,7 +124,8 @@ class DataCollector:
             battery = psutil.sensors_battery()
             if battery:
                 return {
-                    'percent': battery.percent,
+                    # Rounded to the precision shown so sensor noise doesn't register as a change
+                    'percent': round(battery.percent, 1),
                     'power_plugged': battery.power_plugged,
                     'secsleft': battery.secsleft,
                 }
@@ -167,7 +171,7 @@ class DataCollector:
                     frac = (swapped & 0xFF) / 256.0
                     percent_float = percent + frac
                     return {
-                        'percent': float(percent_float),
+                        'percent': round(float(percent_float), 1),
                         'power_plugged': None,
                         'secsleft': None,
                     }
@@ -180,20 +184,31 @@ class DataCollector:
 
     def update_data(self):
         """Updates all data"""
-        self.data['ip_address'] = self.get_local_ip()
-        self.data['wifi_ssid'] = self.get_wifi_ssid()
-        self.data['usb_devices'] = self.get_usb_devices()
-        self.data['system_info'] = self.get_system_info()
-        self.data['battery_info'] = self.get_battery_info() # Update battery info
+        # Collect into a fresh dict so the slow calls below run without holding the lock
+        data = {
+            'ip_address': self.get_local_ip(),
+            'wifi_ssid': self.get_wifi_ssid(),
+            'usb_devices': self.get_usb_devices(),
+            'system_info': self.get_system_info(),
+            'battery_info': self.get_battery_info(), # Update battery info
+        }
 
         # Update connection status
-        if (self.data['ip_address'] != "IP Unavailable" and
-            self.data['wifi_ssid'] not in ["WiFi Not Connected", "SSID Unavailable"]):
-            self.data['connection_status'] = "Connected"
+        if (data['ip_address'] != "IP Unavailable" and
+            data['wifi_ssid'] not in ["WiFi Not Connected", "SSID Unavailable"]):
+            data['connection_status'] = "Connected"
         else:
-            self.data['connection_status'] = "Disconnected"
+            data['connection_status'] = "Disconnected"
+
+        data['last_update'] = time.time()
+
+        with self.lock:
+            self.data = data
 
-        self.data['last_update'] = time.time()
+    def get_snapshot(self):
+        """Returns a copy of the latest data that stays consistent while the caller uses it."""
+        with self.lock:
+            return dict(self.data)
 
     def get_available_wifi_networks(self):
         """Scans for and returns a list of available WiFi SSIDs."""
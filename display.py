@@ -38,10 +38,33 @@ import socket
 import re
 from datetime import datetime
 import json
+from collections import OrderedDict, namedtuple
 
 # DEBUG_MODEを制御するためのグローバル変数
 DEBUG_MODE = True # Trueに設定すると、デバッグ機能が有効になります
 
+# RPiProductInterface._render が保持する描画済みテキストの最大数
+TEXT_CACHE_SIZE = 128
+
+# QRコードのパレット（モジュールの値をインデックスとする）: 明モジュールは白、暗モジュールは黒
+QR_PALETTE = [(255, 255, 255), (0, 0, 0)]
+
+# QRコードの1モジュールあたりのピクセル数
+QR_BOX_SIZE = 3
+
+# データスレッドがメインループの event.wait() を起こすためのイベント
+UI_WAKE_EVENT = pygame.USEREVENT + 1
+
+# メインループが処理するイベントの種類（それ以外は SDL 側で破棄する）
+HANDLED_EVENTS = [pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.FINGERDOWN, UI_WAKE_EVENT]
+
+# データスレッドが公開する読み取り専用のデータ
+# 更新のたびに新しいインスタンスを作り、属性の代入1回で差し替える
+Snapshot = namedtuple('Snapshot', [
+    'ip_address', 'wifi_ssid', 'connection_status', 'network_lines', 'usb_names', 'usb_size_strs',
+    'backup_ssd', 'system_info', 'battery_info', 'last_update',
+])
+
 class DisplayManager:
     """ディスプレイマネージャー - さまざまなディスプレイ環境を処理"""
 
@@ -180,7 +203,9 @@ class RPiProductInterface:
     def __init__(self, display_manager):
         self.display_manager = display_manager
         self.running = True
+        self._rebooting = False # 再起動コマンドを実行済みか
         self.qr_code_surface = None # QRコードのSurfaceを保持
+        self._qr_for_ip = None # qr_code_surface の生成元IPアドレス
         self.setup_pygame()
         self.setup_ui()
         self.setup_data()
@@ -194,7 +219,15 @@ class RPiProductInterface:
         # ディスプレイ方法に基づいて画面を設定
         if self.display_manager.display_method == "framebuffer":
             # フレームバッファモード - フルスクリーン
-            self.screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+            info = pygame.display.Info()
+            self.width, self.height = info.current_w, info.current_h
+            try:
+                # SCALED はソフトウェアでのコピーではなく SDL のレンダラー経由で画面に表示する
+                self.screen = pygame.display.set_mode((self.width, self.height),
+                                                      pygame.FULLSCREEN | pygame.SCALED | pygame.DOUBLEBUF, vsync=1)
+            except pygame.error as e:
+                print(f"高速表示モードが使用できません ({e})、通常のフルスクリーンを使用します")
+                self.screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
             self.width, self.height = self.screen.get_size()
         else:
             # その他のモード - 固定サイズ
@@ -205,6 +238,10 @@ class RPiProductInterface:
         
         # マウスカーソルを非表示にする（製品モード）
         pygame.mouse.set_visible(False)
+
+        # マウス移動やウィンドウイベントはキューに入れない
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(HANDLED_EVENTS)
         
         print(f"✓ 画面の初期化が完了しました: {self.width}x{self.height}")
 
@@ -247,19 +284,127 @@ class RPiProductInterface:
             'refresh': pygame.Rect(self.width - 120, 5, 50, 30),
         }
 
+        # カードの位置とサイズ（起動後は変わらないので一度だけ計算）
+        header_h = self.layout['header_height']
+        margin = self.layout['card_margin']
+        padding = self.layout['card_padding']
+        cards_top = header_h + margin * 2 + 100
+        status_top = self.height - 30
+        half_card_w = self.width // 2 - margin * 3 // 2
+        network_rect = pygame.Rect(margin, header_h + margin, self.width - 2 * margin, 100)
+        system_rect = pygame.Rect(margin, cards_top, half_card_w, 80)
+        usb_rect = pygame.Rect(self.width // 2 + margin // 2, cards_top, half_card_w, 80)
+        network_x = network_rect.x + padding
+        network_y = network_rect.y + padding
+        self.geom = {
+            'header_rect': pygame.Rect(0, 0, self.width, header_h),
+            'header_text_y': header_h // 2 - self.font_tiny.get_height() // 2,
+            'network_card_rect': network_rect,
+            # タイトル、IP、WiFi、接続状態の各行の位置
+            'network_text_pos': [(network_x, network_y), (network_x, network_y + 25),
+                                 (network_x, network_y + 45), (network_x, network_y + 65)],
+            'qr_right': network_rect.right - padding,
+            'qr_y': network_y + self.font_medium.get_height() // 2, # ヘッダーの中央に配置
+            'system_card_rect': system_rect,
+            'system_text_origin': (system_rect.x + padding, system_rect.y + padding),
+            'usb_card_rect': usb_rect,
+            'usb_text_origin': (usb_rect.x + padding, usb_rect.y + padding),
+            'status_rect': pygame.Rect(0, status_top, self.width, 30),
+            'status_text_pos': (10, status_top + 8),
+            'status_dot_center': (self.width - 20, status_top + 15),
+        }
+
+        # ボタンの当たり判定用の (左, 上, 右, 下) 座標
+        self._refresh_bbox = self._bbox(self.touch_areas['refresh'])
+        self._restart_bbox = self._bbox(self.touch_areas['restart'])
+
+        # 画面を重ならない領域に分割し、内容が変わった領域だけ再描画する
+        self.card_regions = {
+            'header': pygame.Rect(0, 0, self.width, header_h),
+            'network': pygame.Rect(0, header_h, self.width, cards_top - header_h),
+            'system': pygame.Rect(0, cards_top, self.width // 2, status_top - cards_top),
+            'usb': pygame.Rect(self.width // 2, cards_top, self.width - self.width // 2, status_top - cards_top),
+            'status': pygame.Rect(0, status_top, self.width, 30),
+        }
+        self.card_draw = {
+            'header': self.draw_header,
+            'network': self.draw_network_card,
+            'system': self.draw_system_card,
+            'usb': self.draw_usb_card,
+            'status': self.draw_status_bar,
+        }
+        # データスレッドが更新したカード（メインスレッドで再描画）
+        self._dirty_cards = set(self.card_regions)
+        self._dirty_lock = threading.Lock()
+
+        # 描画済みテキストのキャッシュ（フォント・文字列・色ごと）
+        self._text_cache = OrderedDict()
+        # 毎秒変わる文字列は最後の1つだけ保持する
+        self._datetime_text = (None, None)
+        self._update_time_text = (None, None)
+
+        # 変化しないラベルは一度だけ描画しておく
+        self.title_network = self._render(self.font_medium, "ネットワーク状態", self.colors['accent'])
+        self.title_system = self._render(self.font_small, "システム", self.colors['accent'])
+        self.title_usb = self._render(self.font_small, "備份 SSD / USB", self.colors['accent'])
+        self.label_refresh = self._render(self.font_small, "更新", self.colors['text'])
+        self.label_restart = self._render(self.font_small, "再起動", self.colors['text'])
+        self.label_no_battery = self._render(self.font_small, "バッテリー: N/A", self.colors['text_dim'])
+        self.label_no_usb = self._render(self.font_small, "無外接裝置", self.colors['text_dim'])
+
+        # 各領域の背景（余白とカードの枠）を一度だけ描画しておき、再描画時はblit 1回で済ませる
+        card_shapes = {
+            'header': (self.geom['header_rect'], 0),
+            'network': (self.geom['network_card_rect'], 10),
+            'system': (self.geom['system_card_rect'], 10),
+            'usb': (self.geom['usb_card_rect'], 10),
+            'status': (self.geom['status_rect'], 0),
+        }
+        self.card_backgrounds = {}
+        for name, region in self.card_regions.items():
+            card_rect, radius = card_shapes[name]
+            background = pygame.Surface(region.size).convert()
+            background.fill(self.colors['bg'])
+            pygame.draw.rect(background, self.colors['card'], card_rect.move(-region.x, -region.y),
+                             border_radius=radius)
+            self.card_backgrounds[name] = background
+
+    @staticmethod
+    def _bbox(rect):
+        """Rect を整数比較で当たり判定できる (左, 上, 右, 下) のタプルに変換"""
+        return (rect.left, rect.top, rect.right, rect.bottom)
+
+    def _render(self, font, text, color):
+        """テキストを描画（同じ引数の結果は再利用）"""
+        key = (id(font), text, color)
+        surf = self._text_cache.get(key)
+        if surf is None:
+            surf = font.render(text, True, color).convert_alpha()
+            self._text_cache[key] = surf
+            if len(self._text_cache) > TEXT_CACHE_SIZE:
+                self._text_cache.popitem(last=False)
+        else:
+            self._text_cache.move_to_end(key)
+        return surf
+
     def setup_data(self):
         """データ管理の設定"""
-        self.data = {
-            'ip_address': 'ロード中...',
-            'wifi_ssid': 'ロード中...',
-            'connection_status': 'チェック中...',
-            'usb_devices': [],
-            'backup_ssd': {},
-            'system_info': {},
-            'battery_info': {}, # バッテリー情報用
-            'last_update': time.time()
-        }
+        self._snapshot = Snapshot(
+            ip_address='ロード中...',
+            wifi_ssid='ロード中...',
+            connection_status='チェック中...',
+            network_lines=self.format_network_lines('ロード中...', 'ロード中...', 'チェック中...'),
+            usb_names=(),
+            usb_size_strs=(),
+            backup_ssd={},
+            system_info={},
+            battery_info={}, # バッテリー情報用
+            last_update=time.time(),
+        )
         
+        # 手動更新や終了時にデータスレッドの待機を解除するためのイベント
+        self._refresh_event = threading.Event()
+
         # データ更新スレッドの起動
         self.data_thread = threading.Thread(target=self.data_update_loop, daemon=True)
         self.data_thread.start()
@@ -471,28 +616,66 @@ WantedBy=graphical-session.target
         except Exception:
             return {}
 
+    def format_network_lines(self, ip_address, wifi_ssid, connection_status):
+        """ネットワークカードの IP・WiFi・接続状態の各行を (文字列, 色) のタプルにまとめる"""
+        colors = self.colors
+        status_color = colors['success'] if connection_status == "接続済み" else colors['error']
+        return (
+            (f"IP: {ip_address}", colors['text']),
+            (f"WiFi: {wifi_ssid}", colors['text']),
+            (f"状態: {connection_status}", status_color),
+        )
+
     def update_data(self):
         """すべてのデータを更新"""
-        self.data['ip_address'] = self.get_local_ip()
-        self.data['wifi_ssid'] = self.get_wifi_ssid()
-        self.data['usb_devices'] = self.get_usb_devices()
-        self.data['backup_ssd'] = self.get_backup_ssd_info()
-        self.data['system_info'] = self.get_system_info()
-        self.data['battery_info'] = self.get_battery_info() # バッテリー情報を更新
+        ip_address = self.get_local_ip()
+        wifi_ssid = self.get_wifi_ssid()
         
         # 接続状態を更新
-        if (self.data['ip_address'] != "IP取得不可" and 
-            self.data['wifi_ssid'] not in ["WiFi未接続", "SSID取得不可"]):
-            self.data['connection_status'] = "接続済み"
+        if (ip_address != "IP取得不可" and 
+            wifi_ssid not in ["WiFi未接続", "SSID取得不可"]):
+            connection_status = "接続済み"
         else:
-            self.data['connection_status'] = "接続異常"
+            connection_status = "接続異常"
         
-        self.data['last_update'] = time.time()
+        # USBカードに表示する外接裝置（內部 SD 卡 mmcblk* を除く、最大2つ）は
+        # 名前とサイズ表示の文字列を並列のタプルにして、描画時の辞書参照と整形を省く
+        usb_devices = self.get_usb_devices()
+        visible_devices = [d for d in usb_devices if 'mmcblk' not in (d.get('name') or '')][:2]
+        
+        snap = Snapshot(
+            ip_address=ip_address,
+            wifi_ssid=wifi_ssid,
+            connection_status=connection_status,
+            network_lines=self.format_network_lines(ip_address, wifi_ssid, connection_status),
+            usb_names=tuple(d.get('name', '') for d in visible_devices),
+            usb_size_strs=tuple(f"{d.get('used',0):.1f}/{d.get('total',0):.1f}GB" for d in visible_devices),
+            backup_ssd=self.get_backup_ssd_info(),
+            system_info=self.get_system_info(),
+            battery_info=self.get_battery_info(), # バッテリー情報を更新
+            last_update=time.time(),
+        )
+        # 代入1回で公開するので、描画側が途中の状態を読むことはない
+        prev = self._snapshot
+        self._snapshot = snap
+        prev_qr = self.qr_code_surface
         self.generate_qr_code() # データ更新時にQRコードを再生成
+
+        # 表示内容が前回と同じカードは再描画しない（更新時刻のステータスバーは毎回）
+        dirty = ['status']
+        # QRコードはネットワークカードに描くので、同じIPでの再試行が成功した場合も再描画する
+        if snap.network_lines != prev.network_lines or self.qr_code_surface is not prev_qr:
+            dirty.append('network')
+        if (snap.system_info, snap.battery_info) != (prev.system_info, prev.battery_info):
+            dirty.append('system')
+        if (snap.usb_names, snap.usb_size_strs, snap.backup_ssd) != \
+                (prev.usb_names, prev.usb_size_strs, prev.backup_ssd):
+            dirty.append('usb')
+        self.mark_dirty(*dirty)
         if DEBUG_MODE:
             try:
-                print("DEBUG: backup_ssd=", self.data.get('backup_ssd'))
-                print("DEBUG: usb_devices=", self.data.get('usb_devices'))
+                print("DEBUG: backup_ssd=", snap.backup_ssd)
+                print("DEBUG: usb_devices=", usb_devices)
             except Exception:
                 pass
 
@@ -501,254 +684,319 @@ WantedBy=graphical-session.target
         while self.running:
             try:
                 self.update_data()
-                time.sleep(3)  # 3秒ごとに更新
+                self._refresh_event.wait(3)  # 3秒ごとに更新（手動更新・終了時はすぐ解除）
+                self._refresh_event.clear()
             except Exception as e:
                 # print(f"データ更新ループエラー: {e}")
-                time.sleep(5)
+                self._refresh_event.wait(5)
+                self._refresh_event.clear()
+
+    def request_data_refresh(self):
+        """次の3秒周期を待たずにデータスレッドで更新させる"""
+        self._refresh_event.set()
 
     def generate_qr_code(self):
         """QRコードを生成してPygameのSurfaceに変換"""
-        ip = self.data['ip_address']
-        if ip != "IP取得不可":
+        ip = self._snapshot.ip_address
+        # IPアドレスが変わっていなければ再生成しない
+        if ip == self._qr_for_ip:
+            return
+        if ip == "IP取得不可":
+            self.qr_code_surface = None
+            self._qr_for_ip = ip
+            return
+        try:
             qr_data = f"http://{ip}:5000" # 接続先URL
             qr = qrcode.QRCode(
                 version=1,
                 error_correction=qrcode.constants.ERROR_CORRECT_L,
-                box_size=3, # QRコードのサイズを調整
+                box_size=QR_BOX_SIZE, # QRコードのサイズを調整
                 border=1, # 境界線
             )
             qr.add_data(qr_data)
             qr.make(fit=True)
-            img = qr.make_image(fill_color="black", back_color="white").convert('RGB')
-            
-            # PILイメージをPygame Surfaceに変換
-            self.qr_code_surface = pygame.image.fromstring(img.tobytes(), img.size, img.mode)
-        else:
+
+            # PILで画像を作らず、モジュール行列（境界線を含む）から1モジュール1ピクセルで直接作る
+            # 各モジュールの真偽値をそのままパレットのインデックスとして使う
+            matrix = qr.get_matrix()
+            modules = len(matrix)
+            pixels = bytes(module for row in matrix for module in row)
+            qr_image = pygame.image.frombuffer(pixels, (modules, modules), 'P')
+            qr_image.set_palette(QR_PALETTE)
+
+            # 最近傍で box_size 倍に拡大し、毎フレームのblitで変換が起きないよう一度だけ画面のピクセル形式に変換
+            size = modules * QR_BOX_SIZE
+            surface = pygame.transform.scale(qr_image, (size, size)).convert()
+        except Exception as e:
+            print(f"QRコード生成エラー: {e}")
+            # 生成元IPを記録しないので、次回のデータ更新で再試行する
             self.qr_code_surface = None
+            return
+        self.qr_code_surface = surface
+        self._qr_for_ip = ip # 生成に成功してから記録する
 
     def draw_header(self):
         """上部ヘッダーバーの描画"""
-        header_rect = pygame.Rect(0, 0, self.width, self.layout['header_height'])
-        pygame.draw.rect(self.screen, self.colors['card'], header_rect)
+        g = self.geom
         
         # 現在の日付と時刻
-        current_datetime = datetime.now().strftime("%Y/%m/%d %H:%M:%S")
-        datetime_text = self.font_tiny.render(current_datetime, True, self.colors['text_dim'])
-        datetime_rect = datetime_text.get_rect()
-        self.screen.blit(datetime_text, (self.width - datetime_rect.width - 10, 
-                                        self.layout['header_height'] // 2 - datetime_rect.height // 2))
+        # 秒が変わったときだけ strftime で整形し直す
+        now = time.time()
+        now_second = int(now)
+        if self._datetime_text[0] != now_second:
+            current_datetime = datetime.fromtimestamp(now).strftime("%Y/%m/%d %H:%M:%S")
+            self._datetime_text = (now_second,
+                                   self.font_tiny.render(current_datetime, True, self.colors['text_dim']).convert_alpha())
+        datetime_text = self._datetime_text[1]
+        self.screen.blit(datetime_text, (self.width - datetime_text.get_width() - 10, g['header_text_y']))
         
         # デバッグモードの場合のみボタンを表示
         if DEBUG_MODE:
             # 更新ボタン
             pygame.draw.rect(self.screen, self.colors['accent'], self.touch_areas['refresh'])
-            refresh_text = self.font_small.render("更新", True, self.colors['text'])
+            refresh_text = self.label_refresh
             refresh_rect = refresh_text.get_rect(center=self.touch_areas['refresh'].center)
             self.screen.blit(refresh_text, refresh_rect)
 
             # 再起動ボタン
             pygame.draw.rect(self.screen, self.colors['error'], self.touch_areas['restart'])
-            restart_text = self.font_small.render("再起動", True, self.colors['text'])
+            restart_text = self.label_restart
             restart_rect = restart_text.get_rect(center=self.touch_areas['restart'].center)
             self.screen.blit(restart_text, restart_rect)
 
 
     def draw_network_card(self):
         """ネットワーク情報カードの描画"""
-        y_start = self.layout['header_height'] + self.layout['card_margin']
-        card_height = 100
-        card_rect = pygame.Rect(self.layout['card_margin'], y_start, 
-                               self.width - 2 * self.layout['card_margin'], card_height)
-        
-        pygame.draw.rect(self.screen, self.colors['card'], card_rect, border_radius=10)
-        
-        x = card_rect.x + self.layout['card_padding']
-        y = card_rect.y + self.layout['card_padding']
+        snap = self._snapshot
+        g = self.geom
+        title_pos, ip_pos, wifi_pos, status_pos = g['network_text_pos']
+        (ip_line, ip_color), (wifi_line, wifi_color), (status_line, status_color) = snap.network_lines
         
         # カードタイトル
-        title = self.font_medium.render("ネットワーク状態", True, self.colors['accent'])
-        self.screen.blit(title, (x, y))
-        y += 25
+        self.screen.blit(self.title_network, title_pos)
         
         # IPアドレス
-        ip_text = self.font_small.render(f"IP: {self.data['ip_address']}", True, self.colors['text'])
-        self.screen.blit(ip_text, (x, y))
+        ip_text = self._render(self.font_small, ip_line, ip_color)
+        self.screen.blit(ip_text, ip_pos)
 
         # QRコードの描画
-        if self.qr_code_surface:
-            qr_x = card_rect.right - self.layout['card_padding'] - self.qr_code_surface.get_width()
-            qr_y = card_rect.y + self.layout['card_padding'] + self.font_medium.get_height() // 2 # ヘッダーの中央に配置
-            self.screen.blit(self.qr_code_surface, (qr_x, qr_y))
-        
-        y += 20
+        qr_surface = self.qr_code_surface
+        if qr_surface:
+            self.screen.blit(qr_surface, (g['qr_right'] - qr_surface.get_width(), g['qr_y']))
         
         # WiFi名
-        wifi_text = self.font_small.render(f"WiFi: {self.data['wifi_ssid']}", True, self.colors['text'])
-        self.screen.blit(wifi_text, (x, y))
-        y += 20
+        wifi_text = self._render(self.font_small, wifi_line, wifi_color)
+        self.screen.blit(wifi_text, wifi_pos)
         
         # 接続状態
-        status_color = self.colors['success'] if self.data['connection_status'] == "接続済み" else self.colors['error']
-        status_text = self.font_small.render(f"状態: {self.data['connection_status']}", True, status_color)
-        self.screen.blit(status_text, (x, y))
+        status_text = self._render(self.font_small, status_line, status_color)
+        self.screen.blit(status_text, status_pos)
 
     def draw_system_card(self):
         """システム情報カードの描画（温度とバッテリーのみ）"""
-        y_start = self.layout['header_height'] + self.layout['card_margin'] * 2 + 100
-        card_height = 80
-        card_rect = pygame.Rect(self.layout['card_margin'], y_start, 
-                               self.width // 2 - self.layout['card_margin'] * 1.5, card_height)
-        
-        pygame.draw.rect(self.screen, self.colors['card'], card_rect, border_radius=10)
-        
-        x = card_rect.x + self.layout['card_padding']
-        y = card_rect.y + self.layout['card_padding']
+        snap = self._snapshot
+        x, y = self.geom['system_text_origin']
         
         # システム情報
-        title = self.font_small.render("システム", True, self.colors['accent'])
-        self.screen.blit(title, (x, y))
+        self.screen.blit(self.title_system, (x, y))
         y += 18
         
-        if self.data['system_info']:
-            sys_info = self.data['system_info']
-            temp_text = self.font_small.render(f"温度: {sys_info.get('temp', 'N/A')}", True, self.colors['text'])
+        if snap.system_info:
+            sys_info = snap.system_info
+            temp_text = self._render(self.font_small, f"温度: {sys_info.get('temp', 'N/A')}", self.colors['text'])
             self.screen.blit(temp_text, (x, y))
             y += 15
         
         # バッテリー情報
-        if self.data['battery_info']:
-            battery_info = self.data['battery_info']
+        if snap.battery_info:
+            battery_info = snap.battery_info
             battery_percent = battery_info.get('percent', 'N/A')
-            battery_text = self.font_small.render(f"バッテリー: {battery_percent:.1f}%", True, self.colors['text'])
+            battery_text = self._render(self.font_small, f"バッテリー: {battery_percent:.1f}%", self.colors['text'])
             self.screen.blit(battery_text, (x, y))
         else:
-            no_battery_text = self.font_small.render("バッテリー: N/A", True, self.colors['text_dim'])
-            self.screen.blit(no_battery_text, (x, y))
+            self.screen.blit(self.label_no_battery, (x, y))
 
 
     def draw_usb_card(self):
         """USBデバイスカードの描画"""
-        y_start = self.layout['header_height'] + self.layout['card_margin'] * 2 + 100
-        card_height = 80
-        card_rect = pygame.Rect(self.width // 2 + self.layout['card_margin'] * 0.5, y_start, 
-                               self.width // 2 - self.layout['card_margin'] * 1.5, card_height)
-        
-        pygame.draw.rect(self.screen, self.colors['card'], card_rect, border_radius=10)
-        
-        x = card_rect.x + self.layout['card_padding']
-        y = card_rect.y + self.layout['card_padding']
+        snap = self._snapshot
+        x, y = self.geom['usb_text_origin']
         
         # 表示: 儲存裝置（優先顯示備份SSD，若無則顯示外接USB）
-        title = self.font_small.render("備份 SSD / USB", True, self.colors['accent'])
-        self.screen.blit(title, (x, y))
+        self.screen.blit(self.title_usb, (x, y))
         y += 18
 
-        ssd = self.data.get('backup_ssd', {})
+        ssd = snap.backup_ssd
         if ssd.get('present'):
-            name_text = self.font_small.render(f"SSD: {ssd.get('device')}", True, self.colors['text'])
+            name_text = self._render(self.font_small, f"SSD: {ssd.get('device')}", self.colors['text'])
             self.screen.blit(name_text, (x, y))
             y += 12
 
-            size_text = self.font_small.render(f"{ssd.get('used',0):.1f}/{ssd.get('total',0):.1f}GB ({ssd.get('percent',0):.0f}%)", 
-                                              True, self.colors['text_dim'])
+            size_text = self._render(self.font_small, f"{ssd.get('used',0):.1f}/{ssd.get('total',0):.1f}GB ({ssd.get('percent',0):.0f}%)", 
+                                     self.colors['text_dim'])
             self.screen.blit(size_text, (x, y))
             y += 12
 
-            mount_text = self.font_small.render(f"掛載: {ssd.get('mount')}", True, self.colors['text_dim'])
+            mount_text = self._render(self.font_small, f"掛載: {ssd.get('mount')}", self.colors['text_dim'])
             self.screen.blit(mount_text, (x, y))
         else:
             # 顯示目標備份磁碟資訊，即使未掛載也要顯示該目標 (避免顯示內建 mmcblk0p1)
             target_mount = '/mnt/backup_drive'
             if not ssd.get('present'):
-                target_text = self.font_small.render(f"目標: {target_mount} (未掛載)", True, self.colors['warning'])
+                target_text = self._render(self.font_small, f"目標: {target_mount} (未掛載)", self.colors['warning'])
                 self.screen.blit(target_text, (x, y))
                 y += 14
 
-            # 列出外接裝置，過濾掉內部 SD 卡 (mmcblk*)
-            visible_devices = [d for d in self.data.get('usb_devices', []) if 'mmcblk' not in (d.get('name') or '')]
-            if visible_devices:
-                for device in visible_devices[:2]:  # 最大2つ表示
-                    name_text = self.font_small.render(device.get('name', ''), True, self.colors['text'])
+            # 列出外接裝置（update_data で內部 SD 卡を除外し、最大2つに絞り込み済み）
+            if snap.usb_names:
+                for name, size_str in zip(snap.usb_names, snap.usb_size_strs):
+                    name_text = self._render(self.font_small, name, self.colors['text'])
                     self.screen.blit(name_text, (x, y))
                     y += 12
 
-                    size_text = self.font_small.render(f"{device.get('used',0):.1f}/{device.get('total',0):.1f}GB", 
-                                                     True, self.colors['text_dim'])
+                    size_text = self._render(self.font_small, size_str, self.colors['text_dim'])
                     self.screen.blit(size_text, (x, y))
                     y += 15
             else:
-                no_usb_text = self.font_small.render("無外接裝置", True, self.colors['text_dim'])
-                self.screen.blit(no_usb_text, (x, y))
+                self.screen.blit(self.label_no_usb, (x, y))
 
     def draw_status_bar(self):
         """下部ステータスバーの描画"""
-        y_start = self.height - 30
-        status_rect = pygame.Rect(0, y_start, self.width, 30)
-        pygame.draw.rect(self.screen, self.colors['card'], status_rect)
+        snap = self._snapshot
+        g = self.geom
         
         # 更新時間
-        update_time = datetime.fromtimestamp(self.data['last_update']).strftime("%H:%M:%S")
-        update_text = self.font_small.render(f"更新: {update_time}", True, self.colors['text_dim'])
-        self.screen.blit(update_text, (10, y_start + 8))
+        # 更新時刻が変わったときだけ整形し直す
+        if self._update_time_text[0] != snap.last_update:
+            update_time = datetime.fromtimestamp(snap.last_update).strftime("%H:%M:%S")
+            self._update_time_text = (snap.last_update,
+                                      self.font_small.render(f"更新: {update_time}", True, self.colors['text_dim']).convert_alpha())
+        update_text = self._update_time_text[1]
+        self.screen.blit(update_text, g['status_text_pos'])
         
         # 実行状態インジケータ
         status_color = self.colors['success']
-        pygame.draw.circle(self.screen, status_color, (self.width - 20, y_start + 15), 5)
+        pygame.draw.circle(self.screen, status_color, g['status_dot_center'], 5)
+
+    def draw_reboot_overlay(self):
+        """再起動中の全画面表示"""
+        self.screen.fill(self.colors['bg'])
+        text = self._render(self.font_medium, "システムを再起動しています…", self.colors['text'])
+        self.screen.blit(text, text.get_rect(center=(self.width // 2, self.height // 2)))
+
+    def mark_dirty(self, *cards, wake=True):
+        """カードを次のフレームで再描画するように登録"""
+        with self._dirty_lock:
+            self._dirty_cards.update(cards)
+        if not wake:
+            return
+        # 待機中のメインループを起こす（ディスプレイ終了後は何もしない）
+        try:
+            pygame.event.post(pygame.event.Event(UI_WAKE_EVENT))
+        except pygame.error:
+            pass
+
+    def redraw_cards(self):
+        """変更されたカードだけを再描画し、更新した領域のリストを返す"""
+        with self._dirty_lock:
+            dirty = self._dirty_cards
+            self._dirty_cards = set()
+
+        rects = []
+        for name in dirty:
+            region = self.card_regions[name]
+            # 領域外へのはみ出しを防ぐ
+            self.screen.set_clip(region)
+            self.screen.blit(self.card_backgrounds[name], region)
+            self.card_draw[name]()
+            rects.append(region)
+        self.screen.set_clip(None)
+        return rects
 
     def handle_touch(self, pos):
         """タッチイベントの処理"""
         if DEBUG_MODE: # DEBUG_MODEの場合のみボタンを処理
-            if self.touch_areas['refresh'].collidepoint(pos):
+            x, y = pos
+            left, top, right, bottom = self._refresh_bbox
+            if left <= x < right and top <= y < bottom:
                 print("手動でデータを更新しています")
-                threading.Thread(target=self.update_data, daemon=True).start()
-            elif self.touch_areas['restart'].collidepoint(pos):
-                print("システムを再起動しています")
-                subprocess.run(['sudo', 'reboot'])
+                self.request_data_refresh()
+                return
+            left, top, right, bottom = self._restart_bbox
+            if left <= x < right and top <= y < bottom:
+                if not self._rebooting:
+                    self._rebooting = True
+                    print("システムを再起動しています")
+                    # UIスレッドを止めないよう完了を待たずに実行し、次のフレームで再起動中の表示を出す
+                    subprocess.Popen(['sudo', 'reboot'], start_new_session=True)
 
     def run(self):
         """メイン実行ループ"""
-        clock = pygame.time.Clock()
-        
         print("✓ 製品インターフェースの起動が完了しました")
         print(f"表示方法: {self.display_manager.display_method}")
         print(f"解像度: {self.width}x{self.height}")
+
+        # 最初のフレームは画面全体を描画
+        self.screen.fill(self.colors['bg'])
+        self.mark_dirty(*self.card_regions, wake=False)
+        self.redraw_cards()
+        pygame.display.flip()
+        shown_second = int(time.time())
+        self._next_redraw_ms = pygame.time.get_ticks()
         
         try:
             while self.running:
+                # 次の再描画時刻（時計の次の秒）までイベントを待つ
+                # timeout=0 は無期限待ちになるため、期限切れでも最低1msにする
+                if self._next_redraw_ms is None:
+                    timeout = 0  # 再起動中: 時計を更新しないので次の入力まで待つ
+                else:
+                    timeout = max(1, self._next_redraw_ms - pygame.time.get_ticks())
+                events = [pygame.event.wait(timeout)]
+                events.extend(pygame.event.get(HANDLED_EVENTS))
+
                 # イベントの処理
-                for event in pygame.event.get():
+                for event in events:
                     if event.type == pygame.QUIT:
                         self.running = False
                     elif event.type == pygame.KEYDOWN:
                         if event.key == pygame.K_ESCAPE:
                             self.running = False
                         elif event.key == pygame.K_F5:
-                            self.update_data()
+                            self.request_data_refresh()
                     elif event.type in [pygame.MOUSEBUTTONDOWN, pygame.FINGERDOWN]:
                         if event.type == pygame.MOUSEBUTTONDOWN:
                             self.handle_touch(event.pos)
                         else:
                             touch_pos = (int(event.x * self.width), int(event.y * self.height))
                             self.handle_touch(touch_pos)
+
+                # 再起動中は表示を1回だけ出し、以降はカードを描画しない
+                if self._rebooting:
+                    if self._next_redraw_ms is not None:
+                        self.draw_reboot_overlay()
+                        pygame.display.flip()
+                        self._next_redraw_ms = None
+                    continue
                 
-                # 画面のクリア
-                self.screen.fill(self.colors['bg'])
-                
-                # インターフェースの描画
-                self.draw_header()
-                self.draw_network_card()
-                self.draw_system_card()
-                self.draw_usb_card()
-                self.draw_status_bar()
-                
-                # ディスプレイの更新
-                pygame.display.flip()
-                clock.tick(30)  # 30 FPS
+                # 時計は秒が変わったときだけ更新
+                now = time.time()
+                now_second = int(now)
+                if now_second != shown_second:
+                    shown_second = now_second
+                    self.mark_dirty('header', wake=False)
+                self._next_redraw_ms = pygame.time.get_ticks() + int((now_second + 1 - now) * 1000) + 1
+
+                # 変更されたカードのみ描画し、その領域だけディスプレイに反映
+                changed_rects = self.redraw_cards()
+                if changed_rects:
+                    pygame.display.update(changed_rects)
                 
         except KeyboardInterrupt:
             print("\nプログラムが中断されました")
         finally:
             self.running = False
+            self._refresh_event.set()  # データスレッドを待機から解放して終了させる
             pygame.quit()
 
 def setup_system():
@@ -2,14 +2,44 @@ import pygame
 import time
 from datetime import datetime
 import threading
+import functools
 import re
 import subprocess
 import qrcode
 import os
-import io
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from data_collector import DataCollector
 from sd_copy_manager import SDCopyManager
 
+# Touched once wpa_supplicant.conf is known to contain update_config=1
+WPA_CONF_SENTINEL = Path.home() / ".cache" / "pisdbackup" / "wpa_ok"
+
+# Maximum number of rendered text surfaces kept by RPiProductInterface._cached_render
+TEXT_CACHE_SIZE = 256
+
+# Maximum number of QR code surfaces kept by RPiProductInterface.generate_qrcode
+QR_CACHE_SIZE = 8
+
+# QR code palette indexed by module value: light modules are card grey, dark modules are white
+QR_PALETTE = [(60, 60, 60), (255, 255, 255)]
+
+# Refresh requests closer together than this are treated as one
+REFRESH_DEBOUNCE_S = 0.5
+
+# Posted by worker threads when they publish something to draw, to wake run() from its event wait
+UI_WAKE_EVENT = pygame.USEREVENT + 1
+# Carries a copy status dict from SDCopyManager's threads to run() in its 'status' attribute
+COPY_STATUS_EVENT = pygame.USEREVENT + 2
+
+
+@functools.lru_cache(maxsize=None)
+def load_font(path, size):
+    """Loads a font file (None for pygame's default font) at a size, sharing one Font per pair."""
+    return pygame.font.Font(path, size)
+
+
 class RPiProductInterface:
     """Raspberry Pi Product Interface - Main application class"""
 
@@ -32,6 +62,9 @@ class RPiProductInterface:
         
         self.setup_pygame()
         self.qrcode_surface = None
+        # QR code surfaces keyed by IP address, least recently used first
+        self._qr_cache = OrderedDict()
+        self._qr_lock = threading.Lock()
         self.setup_ui()
         self.setup_data_updates()
         
@@ -49,38 +82,55 @@ class RPiProductInterface:
         self.width = info_object.current_w
         self.height = info_object.current_h
 
-        self.screen = pygame.display.set_mode((self.width, self.height), pygame.FULLSCREEN)
+        try:
+            # SCALED presents the frame through SDL's accelerated renderer instead of copying it
+            # to the window surface in software
+            self.screen = pygame.display.set_mode((self.width, self.height),
+                                                  pygame.FULLSCREEN | pygame.SCALED | pygame.DOUBLEBUF, vsync=1)
+        except pygame.error as e:
+            print(f"Accelerated display mode unavailable ({e}), using software fullscreen")
+            self.screen = pygame.display.set_mode((self.width, self.height), pygame.FULLSCREEN)
 
         pygame.display.set_caption("Raspberry Pi Monitoring System")
         pygame.mouse.set_visible(False)
 
+        # Only queue the events run() handles; motion and window events are dropped inside SDL
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.FINGERDOWN,
+                                  UI_WAKE_EVENT, COPY_STATUS_EVENT])
+
         print(f"✓ Screen initialized and set to fullscreen: {self.width}x{self.height}")
 
     def setup_ui(self):
         """UI element setup"""
-        font_names = [
-            "DejaVuSans",
-            "FreeSans",
-            "Arial",
-            None
-        ]
+        # Resolve the font file once; every size below is loaded from the same path
+        font_path = None
+        for name in ("DejaVuSans", "FreeSans", "Arial"):
+            font_path = pygame.font.match_font(name)
+            if font_path:
+                break
+        else:
+            print("Falling back to Pygame default font")
 
         def get_font(size):
-            for name in font_names:
-                try:
-                    font = pygame.font.SysFont(name, size)
-                    if font.render("A", True, (0,0,0)).get_width() > 0:
-                        return font
-                except Exception:
-                    pass
-            print(f"Falling back to Pygame default font (Size: {size})")
-            return pygame.font.SysFont(None, size)
+            try:
+                return load_font(font_path, size)
+            except (OSError, pygame.error) as e:
+                print(f"Could not load {font_path} ({e}), falling back to Pygame default font (Size: {size})")
+                return load_font(None, size)
 
         self.font_large = get_font(int(self.height * 0.08))
         self.font_medium = get_font(int(self.height * 0.06))
         self.font_small = get_font(int(self.height * 0.04))
         self.font_tiny = get_font(int(self.height * 0.03))
 
+        # Rendered line height is constant per font, so lay out and centre text with these instead of
+        # calling get_height() on the fonts or on each rendered surface
+        self._font_large_h = self.font_large.get_height()
+        self._font_medium_h = self.font_medium.get_height()
+        self._font_small_h = self.font_small.get_height()
+        self._font_tiny_h = self.font_tiny.get_height()
+
         self.colors = {
             'bg': (30, 30, 30),
             'card': (45, 45, 45),
@@ -100,7 +150,23 @@ class RPiProductInterface:
             'card_padding': int(self.height * 0.02),
             'line_spacing_small': int(self.height * 0.05),
             'line_spacing_medium': int(self.height * 0.07),
+            'status_bar_height': int(self.height * 0.08),
+            'footer_height': int(self.height * 0.12),
+            'footer_button_width': int(self.width * 0.2),
+            'stop_button_width': int(self.width * 0.12),
+            'stop_button_height': int(self.height * 0.06),
+            'key_size': int(self.width * 0.08),
+            'key_margin': int(self.width * 0.01),
         }
+        self.layout['status_circle_offset'] = int(self.layout['status_bar_height'] * 0.35)
+        self.layout['status_circle_radius'] = int(self.layout['status_bar_height'] * 0.2)
+        self.layout['footer_button_height'] = int(self.layout['footer_height'] * 0.7)
+
+        # The QR code is scaled to this size once when generated, not on every frame
+        network_text_height = (self._font_medium_h + self.layout['line_spacing_medium'] +
+                               self._font_small_h * 3 + self.layout['line_spacing_small'] * 2)
+        network_card_height = (self.layout['card_padding'] * 2 + network_text_height) * 0.7
+        self.layout['qrcode_size'] = int((network_card_height - self.layout['card_padding'] * 2) * 0.8)
 
         self.touch_areas = {
             'restart': pygame.Rect(self.width - int(self.width * 0.12) - self.layout['card_margin'],
@@ -120,36 +186,208 @@ class RPiProductInterface:
             'copy_stop': pygame.Rect(0, 0, 0, 0)
         }
 
+        # Shown on boards without a battery, i.e. on every frame there
+        self._no_battery_surf = self.font_tiny.render("Battery: N/A", True, self.colors['text_dim']).convert_alpha()
+
+        self._wifi_list_surface_cache = {'page': -1, 'scan_result': None, 'surf': None}
+
+        # Main view geometry. None of it depends on the data shown, so it is computed once here
+        # instead of on every frame in the draw methods.
+        margin = self.layout['card_margin']
+        padding = self.layout['card_padding']
+        card_width = self.width - 2 * margin
+        header_height = self.layout['header_height']
+        status_bar_y = self.height - self.layout['status_bar_height']
+
+        network_card_rect = pygame.Rect(margin, header_height + margin, card_width, network_card_height)
+
+        usb_card_y = network_card_rect.bottom + margin
+        # The progress card is scaled down when an SSD is present. Without one it is sized to fit
+        # the (unscaled) "Please Insert SSD" message.
+        progress_card_height = (self._font_small_h * 3 + padding * 2 + self.layout['line_spacing_small'] * 2) * 0.7
+        progress_card_no_ssd_height = self._font_medium_h + padding * 2 + self.layout['line_spacing_medium'] * 2
+        # The USB card leaves room below it for the (scaled) progress card
+        max_usb_card_height = status_bar_y - usb_card_y - margin - progress_card_height
+        min_usb_card_height = self._font_small_h * 2 + padding * 2 + self.layout['line_spacing_small']
+        usb_card_rect = pygame.Rect(margin, usb_card_y, card_width, max(min_usb_card_height, max_usb_card_height))
+
+        self.geom = {
+            'header_rect': pygame.Rect(0, 0, self.width, header_height),
+            'network_card_rect': network_card_rect,
+            # Centre of the QR code slot, also used to centre the "No IP for QR" placeholder
+            'qrcode_center': (network_card_rect.right - padding - self.layout['qrcode_size'] // 2,
+                              network_card_rect.centery),
+            'usb_card_rect': usb_card_rect,
+            # Bottom limit for device entries; every entry is two font_small lines plus spacing
+            'usb_content_bottom': usb_card_rect.bottom - padding,
+            'usb_device_entry_height': self._font_small_h * 2 + self.layout['line_spacing_small'],
+            'progress_card_rect': pygame.Rect(margin, usb_card_rect.bottom + margin, card_width, progress_card_height),
+            'progress_card_no_ssd_rect': pygame.Rect(margin, usb_card_rect.bottom + margin, card_width, progress_card_no_ssd_height),
+            'status_bar_rect': pygame.Rect(0, status_bar_y, self.width, self.height - status_bar_y),
+        }
+        progress_card_rect = self.geom['progress_card_rect']
+        # Below the title and status lines, spanning the card's inner width
+        self.geom['progress_bar_rect'] = pygame.Rect(progress_card_rect.x + padding,
+                                                     progress_card_rect.y + padding + self.layout['line_spacing_small'] * 2,
+                                                     progress_card_rect.width - 2 * padding,
+                                                     int(self._font_small_h * 0.8))
+        self.geom['copy_stop_rect'] = pygame.Rect(progress_card_rect.right - self.layout['stop_button_width'] - padding,
+                                                  progress_card_rect.bottom - self.layout['stop_button_height'] - padding,
+                                                  self.layout['stop_button_width'], self.layout['stop_button_height'])
+        self.geom['header_text_y'] = header_height // 2 - self._font_tiny_h // 2
+        self.geom['qrcode_pos'] = (network_card_rect.right - padding - self.layout['qrcode_size'],
+                                   network_card_rect.y + (network_card_rect.height - self.layout['qrcode_size']) // 2)
+
+        # Main view sections as full-width screen bands, in drawing order. Each band is only
+        # repainted when the state it shows changes (see draw_main_view).
+        progress_card_y = progress_card_rect.y
+        self.section_rects = {
+            'header': self.geom['header_rect'],
+            'network': pygame.Rect(0, header_height, self.width, usb_card_y - header_height),
+            'usb': pygame.Rect(0, usb_card_y, self.width, progress_card_y - usb_card_y),
+            'progress': pygame.Rect(0, progress_card_y, self.width, status_bar_y - progress_card_y),
+            'status': self.geom['status_bar_rect'],
+        }
+        self._section_state = {}
+
+        # Background left visible around each card in its band. The header and status bar cover
+        # their whole band; the progress card is at least as tall as its shorter variant.
+        section_cards = {
+            'network': network_card_rect,
+            'usb': usb_card_rect,
+            'progress': min(progress_card_rect, self.geom['progress_card_no_ssd_rect'], key=lambda rect: rect.height),
+        }
+        self.section_gaps = {'header': [], 'status': []}
+        for name, card_rect in section_cards.items():
+            band = self.section_rects[name]
+            card_rect = card_rect.clip(band)
+            gaps = [
+                pygame.Rect(band.x, band.y, band.width, card_rect.y - band.y),
+                pygame.Rect(band.x, card_rect.bottom, band.width, band.bottom - card_rect.bottom),
+                pygame.Rect(band.x, card_rect.y, card_rect.x - band.x, card_rect.height),
+                pygame.Rect(card_rect.right, card_rect.y, band.right - card_rect.right, card_rect.height),
+            ]
+            self.section_gaps[name] = [gap for gap in gaps if gap.width > 0 and gap.height > 0]
+        # The main view is composited here and only changed bands are copied to the screen, so
+        # it survives switching to the WiFi views and does not depend on the display surface
+        # keeping its contents between flips
+        self.ui_layer = pygame.Surface((self.width, self.height)).convert()
+
+        # Rounded card and button backgrounds have a fixed size, so they are drawn once here and
+        # blitted afterwards. Buttons with a fixed label have it baked in.
+        card, bg = self.colors['card'], self.colors['bg']
+        self.card_surfaces = {
+            'network': self._rounded_rect_surface(network_card_rect.size, card, bg, 10),
+            'usb': self._rounded_rect_surface(usb_card_rect.size, card, bg, 10),
+            'progress': self._rounded_rect_surface(progress_card_rect.size, card, bg, 10),
+            'progress_no_ssd': self._rounded_rect_surface(self.geom['progress_card_no_ssd_rect'].size, card, bg, 10),
+            'progress_bar': self._rounded_rect_surface(self.geom['progress_bar_rect'].size, self.colors['progress_bg'], card, 5),
+            # Overlaps the progress bar, so its corners must show whatever is beneath
+            'copy_stop': self._rounded_rect_surface(self.geom['copy_stop_rect'].size, self.colors['error'], None, 5, "Stop"),
+        }
+        self._debug_buttons = [
+            (self._rounded_rect_surface(self.touch_areas['refresh'].size, self.colors['accent'], card, 5, "Refresh"),
+             self.touch_areas['refresh']),
+            (self._rounded_rect_surface(self.touch_areas['restart'].size, self.colors['error'], card, 5, "Restart"),
+             self.touch_areas['restart']),
+        ]
+
+        # Rendered text surfaces keyed by (font id, text, color), least recently used first
+        self._text_cache = OrderedDict()
+        self._header_left_state = None
+        self._header_left_surf = None
+        self._last_datetime_sec = None
+        self._datetime_surf = None
+        self._datetime_pos = None
+        self._last_update_shown = None
+        self._update_time_surf = None
+
+    def _rounded_rect_surface(self, size, color, back_color, border_radius, label=None):
+        """Returns a surface with a rounded rectangle drawn on the colour it will sit on, optionally
+        with a centred font_small label. With back_color None the corners are left transparent."""
+        if back_color is None:
+            surf = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+            surf.fill((0, 0, 0, 0))
+        else:
+            surf = pygame.Surface(size).convert()
+            surf.fill(back_color)
+        pygame.draw.rect(surf, color, surf.get_rect(), border_radius=border_radius)
+        if label:
+            label_surf = self.font_small.render(label, True, self.colors['text'])
+            surf.blit(label_surf, label_surf.get_rect(center=surf.get_rect().center))
+        return surf
+
+    def _cached_render(self, font, text, color):
+        """Renders text with antialiasing, reusing the surface from an earlier call with the same arguments."""
+        key = (id(font), text, color)
+        surf = self._text_cache.get(key)
+        if surf is None:
+            # Stored in the display's pixel format so later blits skip the format conversion
+            surf = font.render(text, True, color).convert_alpha()
+            self._text_cache[key] = surf
+            if len(self._text_cache) > TEXT_CACHE_SIZE:
+                self._text_cache.popitem(last=False)
+        else:
+            self._text_cache.move_to_end(key)
+        return surf
+
     def generate_qrcode(self):
         """Generates the QR code for the Raspberry Pi's IP address."""
         ip_address = self.data_collector.data.get('ip_address', 'N/A')
-        if ip_address and ip_address != 'IP Unavailable':
-            try:
-                qr_data = f"http://{ip_address}:5000"
-                qr = qrcode.QRCode(
-                    version=1,
-                    error_correction=qrcode.constants.ERROR_CORRECT_L,
-                    box_size=10,
-                    border=4,
-                )
-                qr.add_data(qr_data)
-                qr.make(fit=True)
-
-                img = qr.make_image(fill_color="white", back_color=(60, 60, 60))
-
-                img_byte_arr = io.BytesIO()
-                img.save(img_byte_arr, format='PNG')
-                img_byte_arr.seek(0)
-
-                self.qrcode_surface = pygame.image.load(img_byte_arr)
-            except Exception as e:
-                print(f"Error generating QR code: {e}")
+        if not ip_address or ip_address == 'IP Unavailable':
+            with self._qr_lock:
                 self.qrcode_surface = None
-        else:
-            self.qrcode_surface = None
+            return
+
+        # The address usually flips between a few values (e.g. across WiFi reconnects)
+        with self._qr_lock:
+            cached = self._qr_cache.get(ip_address)
+            if cached is not None:
+                self._qr_cache.move_to_end(ip_address)
+                self.qrcode_surface = cached
+                return
+
+        try:
+            qr_data = f"http://{ip_address}:5000"
+            qr = qrcode.QRCode(
+                version=1,
+                error_correction=qrcode.constants.ERROR_CORRECT_L,
+                box_size=10,
+                border=4,
+            )
+            qr.add_data(qr_data)
+            qr.make(fit=True)
+
+            # Build the pixels straight from the module matrix (border included), one pixel
+            # per module, instead of encoding and decoding a PNG through PIL. Each module is
+            # its boolean value as a palette index, so the colours come from QR_PALETTE.
+            matrix = qr.get_matrix()
+            modules = len(matrix)
+            pixels = bytes(module for row in matrix for module in row)
+            qr_image = pygame.image.frombuffer(pixels, (modules, modules), 'P')
+            qr_image.set_palette(QR_PALETTE)
+
+            qrcode_size = self.layout['qrcode_size']
+            # Scale to the on-screen size and convert to the display format once, so drawing is a plain blit
+            surface = pygame.transform.scale(qr_image, (qrcode_size, qrcode_size)).convert()
+        except Exception as e:
+            print(f"Error generating QR code: {e}")
+            surface = None
+
+        with self._qr_lock:
+            if surface is not None:
+                self._qr_cache[ip_address] = surface
+                if len(self._qr_cache) > QR_CACHE_SIZE:
+                    self._qr_cache.popitem(last=False)
+            self.qrcode_surface = surface
 
     def setup_data_updates(self):
         """Sets up data updates"""
+        # Set to wake the data thread early (e.g. manual refresh) instead of spawning extra threads
+        self._refresh_event = threading.Event()
+        self._qr_executor = ThreadPoolExecutor(max_workers=1)
+        self._last_refresh_request = float('-inf')
+        self._reboot_pending = False
         self.data_thread = threading.Thread(target=self.data_update_loop, daemon=True)
         self.data_thread.start()
 
@@ -159,6 +397,15 @@ class RPiProductInterface:
         """Updates all data"""
         self.data_collector.update_data()
 
+    def request_data_refresh(self):
+        """Asks the data thread to update now instead of at its next 3 second tick."""
+        # A touch often arrives as both a mouse and a finger event; ignore repeats
+        now = time.monotonic()
+        if now - self._last_refresh_request >= REFRESH_DEBOUNCE_S:
+            self._last_refresh_request = now
+            print("Manually updating data...")
+            self._refresh_event.set()
+
     def data_update_loop(self):
         """Data update loop"""
         last_ip = None
@@ -167,286 +414,269 @@ class RPiProductInterface:
                 self.update_all_data()
                 current_ip = self.data_collector.data.get('ip_address', 'N/A')
                 if current_ip != last_ip:
-                    self.generate_qrcode()
+                    # Generated on its own worker so a slow QR build doesn't delay the next update
+                    self._qr_executor.submit(self.generate_qrcode).add_done_callback(lambda future: self._wake_ui())
                     last_ip = current_ip
-                time.sleep(3)
+                self._wake_ui()
+                self._refresh_event.wait(3)
+                self._refresh_event.clear()
             except Exception as e:
-                time.sleep(5)
+                self._refresh_event.wait(5)
+                self._refresh_event.clear()
 
     def update_copy_status(self, data):
-        """Callback function to receive copy status updates from SDCopyManager."""
-        self.copy_status_data = data
-
-    def draw_header(self):
-        """Draws the top header bar with system info and current date/time"""
-        header_rect = pygame.Rect(0, 0, self.width, self.layout['header_height'])
-        pygame.draw.rect(self.screen, self.colors['card'], header_rect)
+        """Callback function to receive copy status updates from SDCopyManager.
+        It runs on the copy manager's threads, so the status is handed to run() as an event and
+        copy_status_data is only ever replaced on the UI thread."""
+        try:
+            pygame.event.post(pygame.event.Event(COPY_STATUS_EVENT, status=data))
+        except pygame.error:
+            # The initial status arrives before the display is up (and late ones after shutdown)
+            self.copy_status_data = data
 
-        # System Info (Temperature and Battery) - LEFT ALIGNED
-        system_info_x = self.layout['card_margin']
-        system_info_y = self.layout['header_height'] // 2 - (self.font_tiny.get_height() // 2)
+    def _wake_ui(self):
+        """Wakes run() from its event wait so a change made by another thread is drawn right away."""
+        try:
+            pygame.event.post(pygame.event.Event(UI_WAKE_EVENT))
+        except pygame.error:
+            pass # Display not initialized yet or already shut down
 
-        temp_str = f"Temp: {self.data_collector.data['system_info'].get('temp', 'N/A')}" if self.data_collector.data['system_info'] else "Temp: N/A"
-        temp_text = self.font_tiny.render(temp_str, True, self.colors['text_dim'])
-        self.screen.blit(temp_text, (system_info_x, system_info_y))
-        system_info_x += temp_text.get_width() + self.layout['card_padding']
+    def _scan_wifi_networks(self):
+        """Scans for WiFi networks in the background and shows the result."""
+        self.wifi_scan_result = self.data_collector.get_available_wifi_networks()
+        self._wake_ui()
 
-        battery_str = f"Battery: {self.data_collector.data['battery_info'].get('percent', 'N/A'):.1f}%" if self.data_collector.data['battery_info'] else "Battery: N/A"
-        battery_text = self.font_tiny.render(battery_str, True, self.colors['text_dim'])
-        self.screen.blit(battery_text, (system_info_x, system_info_y))
+    def draw_header(self, data, now):
+        """Draws the top header bar with system info and the date/time for timestamp now"""
+        colors = self.colors
+        pygame.draw.rect(self.ui_layer, colors['card'], self.geom['header_rect'])
 
+        # System Info (Temperature and Battery) - LEFT ALIGNED
+        # Both readings are composited into one strip that is only rebuilt when either changes
+        system_info, battery_info = data['system_info'], data['battery_info']
+        header_left_state = (system_info.get('temp', 'N/A') if system_info else "N/A",
+                             battery_info.get('percent', 'N/A') if battery_info else None)
+        if header_left_state != self._header_left_state:
+            self._header_left_state = header_left_state
+            temp, battery_percent = header_left_state
+            temp_text = self.font_tiny.render(f"Temp: {temp}", True, colors['text_dim'])
+            if battery_percent is not None:
+                battery_text = self.font_tiny.render(f"Battery: {battery_percent:.1f}%", True, colors['text_dim'])
+            else:
+                battery_text = self._no_battery_surf
+            battery_x = temp_text.get_width() + self.layout['card_padding']
+            # The strip sits on the solid header background, so it can be opaque
+            strip = pygame.Surface((battery_x + battery_text.get_width(), self._font_tiny_h)).convert()
+            strip.fill(colors['card'])
+            strip.blits(((temp_text, (0, 0)), (battery_text, (battery_x, 0))), doreturn=False)
+            self._header_left_surf = strip
+
+        # Text is queued and drawn with one batched blits() call
+        blit_list = [(self._header_left_surf, (self.layout['card_margin'], self.geom['header_text_y']))]
 
         # Current date and time - RIGHT ALIGNED
-        current_datetime = datetime.now().strftime("%Y/%m/%d %H:%M:%S")
-        datetime_text = self.font_tiny.render(current_datetime, True, self.colors['text_dim'])
-        datetime_rect = datetime_text.get_rect()
-        self.screen.blit(datetime_text, (self.width - datetime_rect.width - self.layout['card_margin'],
-                                        self.layout['header_height'] // 2 - datetime_rect.height // 2))
+        # The clock only changes once a second, so format and render it only then. It is kept out
+        # of the text cache so it doesn't evict the static labels.
+        if int(now) != self._last_datetime_sec:
+            self._last_datetime_sec = int(now)
+            current_datetime = time.strftime("%Y/%m/%d %H:%M:%S", time.localtime(now))
+            self._datetime_surf = self.font_tiny.render(current_datetime, True, colors['text_dim']).convert_alpha()
+            self._datetime_pos = (self.width - self._datetime_surf.get_width() - self.layout['card_margin'],
+                                  self.layout['header_height'] // 2 - self._font_tiny_h // 2)
+        blit_list.append((self._datetime_surf, self._datetime_pos))
+        self.ui_layer.blits(blit_list, doreturn=False)
 
         # Show buttons only in debug mode
         if self.debug_mode:
-            # Refresh button
-            pygame.draw.rect(self.screen, self.colors['accent'], self.touch_areas['refresh'], border_radius=5)
-            refresh_text = self.font_small.render("Refresh", True, self.colors['text'])
-            refresh_rect = refresh_text.get_rect(center=self.touch_areas['refresh'].center)
-            self.screen.blit(refresh_text, refresh_rect)
+            # Refresh and Restart buttons, labels included
+            self.ui_layer.blits(self._debug_buttons, doreturn=False)
 
-            # Restart button
-            pygame.draw.rect(self.screen, self.colors['error'], self.touch_areas['restart'], border_radius=5)
-            restart_text = self.font_small.render("Restart", True, self.colors['text'])
-            restart_rect = restart_text.get_rect(center=self.touch_areas['restart'].center)
-            self.screen.blit(restart_text, restart_rect)
 
-
-    def draw_network_card(self):
+    def draw_network_card(self, data):
         """Draws the network info card and the QR code next to it. Returns its bottom Y coordinate."""
-        y_start = self.layout['header_height'] + self.layout['card_margin']
-
-        text_content_base_height = self.font_medium.get_height() + \
-                                   self.layout['line_spacing_medium'] + \
-                                   self.font_small.get_height() * 3 + \
-                                   self.layout['line_spacing_small'] * 2
-        
-        card_height = (self.layout['card_padding'] * 2 + text_content_base_height) * 0.7
-
-        qrcode_target_size = (card_height - (self.layout['card_padding'] * 2)) * 0.8
-        
-        total_card_width = self.width - 2 * self.layout['card_margin']
-        
-        card_rect = pygame.Rect(self.layout['card_margin'], y_start, total_card_width, card_height)
-        pygame.draw.rect(self.screen, self.colors['card'], card_rect, border_radius=10)
-
-        x = card_rect.x + self.layout['card_padding']
-        y = card_rect.y + self.layout['card_padding']
-
-        title = self.font_medium.render("Network Status", True, self.colors['accent'])
-        self.screen.blit(title, (x, y))
+        colors = self.colors
+        card_rect = self.geom['network_card_rect']
+        self.ui_layer.blit(self.card_surfaces['network'], card_rect)
+
+        padding = self.layout['card_padding']
+        line_spacing = self.layout['line_spacing_small']
+        font_small = self.font_small
+        x = card_rect.x + padding
+        y = card_rect.y + padding
+        blit_list = []
+
+        title = self._cached_render(self.font_medium, "Network Status", colors['accent'])
+        blit_list.append((title, (x, y)))
         y += self.layout['line_spacing_medium']
 
-        ip_text = self.font_small.render(f"IP: {self.data_collector.data['ip_address']}", True, self.colors['text'])
-        self.screen.blit(ip_text, (x, y))
-        y += self.layout['line_spacing_small']
+        ip_text = self._cached_render(font_small, f"IP: {data['ip_address']}", colors['text'])
+        blit_list.append((ip_text, (x, y)))
+        y += line_spacing
 
-        wifi_text = self.font_small.render(f"WiFi: {self.data_collector.data['wifi_ssid']}", True, self.colors['text'])
-        self.screen.blit(wifi_text, (x, y))
-        y += self.layout['line_spacing_small']
+        wifi_text = self._cached_render(font_small, f"WiFi: {data['wifi_ssid']}", colors['text'])
+        blit_list.append((wifi_text, (x, y)))
+        y += line_spacing
 
-        status_color = self.colors['success'] if self.data_collector.data['connection_status'] == "Connected" else self.colors['error']
-        status_text = self.font_small.render(f"Status: {self.data_collector.data['connection_status']}", True, status_color)
-        self.screen.blit(status_text, (x, y))
+        status_color = colors['success'] if data['connection_status'] == "Connected" else colors['error']
+        status_text = self._cached_render(font_small, f"Status: {data['connection_status']}", status_color)
+        blit_list.append((status_text, (x, y)))
 
         # Add "Change WiFi" button
-        button_width = self.font_small.render("Change WiFi", True, self.colors['text']).get_width() + self.layout['card_padding'] * 2
-        button_height = self.font_small.get_height() + self.layout['card_padding']
-        button_x = x + ip_text.get_width() + self.layout['card_padding'] * 2
+        change_wifi_text = self._cached_render(font_small, "Change WiFi", colors['text'])
+        button_width = change_wifi_text.get_width() + padding * 2
+        button_height = self._font_small_h + padding
+        button_x = x + ip_text.get_width() + padding * 2
         button_y = card_rect.y + self.layout['line_spacing_medium']
         self.touch_areas['change_wifi'] = pygame.Rect(button_x, button_y, button_width, button_height)
-        pygame.draw.rect(self.screen, self.colors['accent'], self.touch_areas['change_wifi'], border_radius=5)
-        change_wifi_text = self.font_small.render("Change WiFi", True, self.colors['text'])
-        self.screen.blit(change_wifi_text, (button_x + self.layout['card_padding'], button_y + (button_height - change_wifi_text.get_height()) // 2))
+        pygame.draw.rect(self.ui_layer, colors['accent'], self.touch_areas['change_wifi'], border_radius=5)
+        blit_list.append((change_wifi_text, (button_x + padding, button_y + (button_height - self._font_small_h) // 2)))
 
         if self.qrcode_surface:
-            scaled_qrcode = pygame.transform.scale(self.qrcode_surface, (int(qrcode_target_size), int(qrcode_target_size)))
-            qrcode_x = card_rect.x + card_rect.width - self.layout['card_padding'] - scaled_qrcode.get_width()
-            qrcode_y = card_rect.y + (card_rect.height - scaled_qrcode.get_height()) // 2
-            self.screen.blit(scaled_qrcode, (qrcode_x, qrcode_y))
+            blit_list.append((self.qrcode_surface, self.geom['qrcode_pos']))
         else:
-            no_ip_text = self.font_tiny.render("No IP for QR", True, self.colors['text_dim'])
-            no_ip_x = card_rect.x + card_rect.width - self.layout['card_padding'] - (qrcode_target_size / 2) - (no_ip_text.get_width() / 2)
-            no_ip_y = card_rect.y + (card_rect.height - no_ip_text.get_height()) // 2
-            self.screen.blit(no_ip_text, (no_ip_x, no_ip_y))
-        
-        return card_rect.bottom
-
-    def draw_usb_card(self, y_start):
-        """Draws the USB device card at a given y_start position. Returns its bottom Y coordinate."""
-        status_bar_height = int(self.height * 0.08)
-        
-        # We need to use the scaled height of the progress bar for calculation here
-        progress_bar_height_estimate = (self.font_small.get_height() * 3 + self.layout['card_padding'] * 2 + self.layout['line_spacing_small'] * 2) * 0.7 # Scaled by 0.7
-        
-        max_usb_card_height = self.height - y_start - self.layout['card_margin'] - progress_bar_height_estimate - status_bar_height
+            no_ip_text = self._cached_render(self.font_tiny, "No IP for QR", colors['text_dim'])
+            blit_list.append((no_ip_text, no_ip_text.get_rect(center=self.geom['qrcode_center'])))
 
-        min_usb_card_height = self.font_small.get_height() * 2 + self.layout['card_padding'] * 2 + self.layout['line_spacing_small']
-        card_rect = pygame.Rect(self.layout['card_margin'], y_start,
-                               self.width - 2 * self.layout['card_margin'], max(min_usb_card_height, max_usb_card_height))
+        self.ui_layer.blits(blit_list, doreturn=False)
+        return card_rect.bottom
 
-        pygame.draw.rect(self.screen, self.colors['card'], card_rect, border_radius=10)
+    def draw_usb_card(self, data):
+        """Draws the USB device card. Returns its bottom Y coordinate."""
+        colors = self.colors
+        card_rect = self.geom['usb_card_rect']
+        self.ui_layer.blit(self.card_surfaces['usb'], card_rect)
 
         x = card_rect.x + self.layout['card_padding']
         y = card_rect.y + self.layout['card_padding']
+        blit_list = []
 
-        title = self.font_small.render("USB Devices", True, self.colors['accent'])
-        self.screen.blit(title, (x, y))
+        title = self._cached_render(self.font_small, "USB Devices", colors['accent'])
+        blit_list.append((title, (x, y)))
         y += self.layout['line_spacing_small']
 
-        if self.data_collector.data['usb_devices']:
+        usb_devices = data['usb_devices']
+        if usb_devices:
+            # Bind what the per-device loop uses to locals
+            render = self._cached_render
+            append = blit_list.append
+            font_small = self.font_small
+            font_small_h = self._font_small_h
+            color_text = colors['text']
+            color_dim = colors['text_dim']
+            line_spacing = self.layout['line_spacing_small']
             current_device_y = y
-            for device in self.data_collector.data['usb_devices']:
-                device_entry_height = self.font_small.get_height() * 2 + self.layout['line_spacing_small']
-                
-                if current_device_y + device_entry_height < card_rect.y + card_rect.height - self.layout['card_padding']:
-                    self.screen.blit(self.font_small.render(device['name'], True, self.colors['text']), (x, current_device_y))
-                    current_device_y += self.font_small.get_height()
-                    self.screen.blit(self.font_small.render(f"{device['used']:.1f}/{device['total']:.1f}GB", True, self.colors['text_dim']), (x, current_device_y))
-                    current_device_y += self.font_small.get_height() + self.layout['line_spacing_small']
+            device_entry_height = self.geom['usb_device_entry_height']
+            content_bottom = self.geom['usb_content_bottom']
+            last_index = len(usb_devices) - 1
+            for index, device in enumerate(usb_devices):
+                if current_device_y + device_entry_height < content_bottom:
+                    append((render(font_small, device['name'], color_text), (x, current_device_y)))
+                    current_device_y += font_small_h
+                    append((render(font_small, f"{device['used']:.1f}/{device['total']:.1f}GB", color_dim), (x, current_device_y)))
+                    current_device_y += font_small_h + line_spacing
                 else:
-                    if self.data_collector.data['usb_devices'].index(device) < len(self.data_collector.data['usb_devices']) -1:
-                        more_text = self.font_tiny.render("...more", True, self.colors['text_dim'])
-                        self.screen.blit(more_text, (x, current_device_y))
+                    if index < last_index:
+                        more_text = render(self.font_tiny, "...more", color_dim)
+                        append((more_text, (x, current_device_y)))
                     break
         else:
-            no_usb_text = self.font_small.render("No USB Devices", True, self.colors['text_dim'])
-            self.screen.blit(no_usb_text, (x, y))
+            no_usb_text = self._cached_render(self.font_small, "No USB Devices", colors['text_dim'])
+            blit_list.append((no_usb_text, (x, y)))
 
+        self.ui_layer.blits(blit_list, doreturn=False)
         return card_rect.bottom
 
-    # Helper function to calculate network card's bottom Y without drawing it again
-    def _calculate_network_card_bottom_y(self):
-        y_start = self.layout['header_height'] + self.layout['card_margin']
-        text_content_base_height = self.font_medium.get_height() + \
-                                   self.layout['line_spacing_medium'] + \
-                                   self.font_small.get_height() * 3 + \
-                                   self.layout['line_spacing_small'] * 2
-        card_height = (self.layout['card_padding'] * 2 + text_content_base_height) * 0.7
-        return y_start + card_height
-
-    # Helper function to calculate USB card's bottom Y without drawing it
-    def _calculate_usb_card_bottom_y(self, y_start_for_calc):
-        status_bar_height = int(self.height * 0.08)
-        # Use the scaled height for progress bar estimate
-        progress_bar_height_estimate = (self.font_small.get_height() * 3 + self.layout['card_padding'] * 2 + self.layout['line_spacing_small'] * 2) * 0.7
-        
-        max_usb_card_height = self.height - y_start_for_calc - self.layout['card_margin'] - progress_bar_height_estimate - status_bar_height
-        min_usb_card_height = self.font_small.get_height() * 2 + self.layout['card_padding'] * 2 + self.layout['line_spacing_small']
-        
-        usb_content_height_ideal = 0
-        if self.data_collector.data['usb_devices']:
-            for device in self.data_collector.data['usb_devices']:
-                usb_content_height_ideal += self.font_small.get_height() * 2 + self.layout['line_spacing_small']
+    def draw_progress_bar_card(self, copy_status):
+        """Draws the SD card copy progress bar card for the given copy status."""
+        colors = self.colors
+        layer = self.ui_layer
+        ssd_present = copy_status.get('ssd_present', False)
+        if ssd_present:
+            card_rect = self.geom['progress_card_rect']
+            layer.blit(self.card_surfaces['progress'], card_rect)
         else:
-            usb_content_height_ideal = self.font_small.get_height() * 2 + self.layout['line_spacing_small']
-
-        calculated_card_height = usb_content_height_ideal + self.font_small.get_height() + self.layout['line_spacing_small'] + self.layout['card_padding'] * 2
-
-        final_card_height = max(min_usb_card_height, min(calculated_card_height, max_usb_card_height))
-        
-        return y_start_for_calc + final_card_height
-
-
-    def draw_progress_bar_card(self, y_start):
-        """Draws the SD card copy progress bar card at a given y_start position."""
-        # Fixed height for progress card when SSD is present (now scaled)
-        fixed_progress_card_height_scaled = (self.font_small.get_height() * 3 + self.layout['card_padding'] * 2 + self.layout['line_spacing_small'] * 2) * 0.7
-        
-        ssd_present = self.copy_status_data.get('ssd_present', False)
-        card_height = fixed_progress_card_height_scaled
-        if not ssd_present:
-            # If SSD is not present, use a larger height for the "Please Insert SSD" message
-            # This height is not scaled, as it needs to fit the text clearly
-            card_height = self.font_medium.get_height() + self.layout['card_padding'] * 2 + self.layout['line_spacing_medium'] * 2 
-
-        card_rect = pygame.Rect(self.layout['card_margin'], y_start,
-                               self.width - 2 * self.layout['card_margin'], card_height)
-        pygame.draw.rect(self.screen, self.colors['card'], card_rect, border_radius=10)
+            card_rect = self.geom['progress_card_no_ssd_rect']
+            layer.blit(self.card_surfaces['progress_no_ssd'], card_rect)
 
         x = card_rect.x + self.layout['card_padding']
         y = card_rect.y + self.layout['card_padding']
 
-        title = self.font_small.render("SD Card Copy Progress", True, self.colors['accent'])
-        self.screen.blit(title, (x, y))
+        title = self._cached_render(self.font_small, "SD Card Copy Progress", colors['accent'])
+        layer.blit(title, (x, y))
         y += self.layout['line_spacing_small']
 
-        status_message = self.copy_status_data.get('status_message', 'Initializing...')
-        is_copying = self.copy_status_data.get('is_copying', False)
+        status_message = copy_status.get('status_message', 'Initializing...')
+        is_copying = copy_status.get('is_copying', False)
 
         if not ssd_present:
-            insert_ssd_text = self.font_medium.render("Please Insert SSD!", True, self.colors['error'])
-            insert_ssd_rect = insert_ssd_text.get_rect(center=(card_rect.centerx, card_rect.centery))
-            self.screen.blit(insert_ssd_text, insert_ssd_rect)
+            insert_ssd_text = self._cached_render(self.font_medium, "Please Insert SSD!", colors['error'])
+            insert_ssd_rect = insert_ssd_text.get_rect(center=card_rect.center)
+            layer.blit(insert_ssd_text, insert_ssd_rect)
             return
 
-        status_text = self.font_small.render(f"Status: {status_message}", True, self.colors['text_dim'])
-        self.screen.blit(status_text, (x, y))
-        y += self.layout['line_spacing_small']
+        status_text = self._cached_render(self.font_small, f"Status: {status_message}", colors['text_dim'])
+        layer.blit(status_text, (x, y))
 
-        progress_percent = self.copy_status_data.get('progress_percent', 0.0)
-        bar_width = card_rect.width - 2 * self.layout['card_padding']
-        bar_height = int(self.font_small.get_height() * 0.8)
-        bar_x = x
-        bar_y = y
+        progress_percent = copy_status.get('progress_percent', 0.0)
+        bar_rect = self.geom['progress_bar_rect']
 
-        pygame.draw.rect(self.screen, self.colors['progress_bg'], (bar_x, bar_y, bar_width, bar_height), border_radius=5)
-        pygame.draw.rect(self.screen, self.colors['progress_fill'], (bar_x, bar_y, bar_width * (progress_percent / 100), bar_height), border_radius=5)
+        layer.blit(self.card_surfaces['progress_bar'], bar_rect)
+        fill_width = int(bar_rect.width * progress_percent * 0.01)
+        if fill_width > 0:
+            pygame.draw.rect(layer, colors['progress_fill'], (bar_rect.x, bar_rect.y, fill_width, bar_rect.height), border_radius=5)
 
-        progress_label = f"{progress_percent:.1f}% ({self.copy_status_data.get('copied_files', 0)}/{self.copy_status_data.get('total_files', 0)})"
-        progress_text = self.font_tiny.render(progress_label, True, self.colors['text'])
-        progress_text_rect = progress_text.get_rect(center=(bar_x + bar_width / 2, bar_y + bar_height / 2))
-        self.screen.blit(progress_text, progress_text_rect)
-        y += bar_height + self.layout['line_spacing_small']
+        progress_label = f"{progress_percent:.1f}% ({copy_status.get('copied_files', 0)}/{copy_status.get('total_files', 0)})"
+        # Progress and file names change with nearly every update; rendering them through the
+        # text cache would only evict the static labels
+        progress_text = self.font_tiny.render(progress_label, True, colors['text'])
+        progress_text_rect = progress_text.get_rect(center=bar_rect.center)
+        layer.blit(progress_text, progress_text_rect)
 
-        current_file = self.copy_status_data.get('current_file', '')
+        current_file = copy_status.get('current_file', '')
         if current_file:
-            current_file_text = self.font_tiny.render(f"File: {current_file}", True, self.colors['text_dim'])
-            self.screen.blit(current_file_text, (x, y))
+            current_file_text = self.font_tiny.render(f"File: {current_file}", True, colors['text_dim'])
+            layer.blit(current_file_text, (x, bar_rect.bottom + self.layout['line_spacing_small']))
 
         if is_copying:
-            stop_button_width = int(self.width * 0.12)
-            stop_button_height = int(self.height * 0.06)
-            stop_button_x = card_rect.x + card_rect.width - stop_button_width - self.layout['card_padding']
-            stop_button_y = card_rect.y + card_rect.height - stop_button_height - self.layout['card_padding']
-            
-            self.touch_areas['copy_stop'] = pygame.Rect(stop_button_x, stop_button_y, stop_button_width, stop_button_height)
-
-            pygame.draw.rect(self.screen, self.colors['error'], self.touch_areas['copy_stop'], border_radius=5)
-            stop_text = self.font_small.render("Stop", True, self.colors['text'])
-            stop_rect = stop_text.get_rect(center=self.touch_areas['copy_stop'].center)
-            self.screen.blit(stop_text, stop_rect)
+            self.touch_areas['copy_stop'] = self.geom['copy_stop_rect']
+            layer.blit(self.card_surfaces['copy_stop'], self.touch_areas['copy_stop'])
 
     def draw_wifi_list_view(self):
         """Draws the screen for selecting a WiFi network."""
-        self.screen.fill(self.colors['bg'])
+        # The list only changes on a new scan or page flip, so re-render it only then and blit the cached page otherwise
+        cache = self._wifi_list_surface_cache
+        if (cache['surf'] is None or cache['page'] != self.wifi_list_page or
+                cache['scan_result'] is not self.wifi_scan_result):
+            cache['surf'] = self._render_wifi_list_page()
+            cache['page'] = self.wifi_list_page
+            cache['scan_result'] = self.wifi_scan_result
+        self.screen.blit(cache['surf'], (0, 0))
+
+    def _render_wifi_list_page(self):
+        """Renders the current WiFi list page off-screen and updates its touch areas."""
+        surface = pygame.Surface((self.width, self.height)).convert()
+        surface.fill(self.colors['bg'])
         
         # Back button
-        pygame.draw.rect(self.screen, self.colors['error'], self.touch_areas['wifi_list_back'], border_radius=5)
+        pygame.draw.rect(surface, self.colors['error'], self.touch_areas['wifi_list_back'], border_radius=5)
         back_text = self.font_small.render("Back", True, self.colors['text'])
-        self.screen.blit(back_text, (self.touch_areas['wifi_list_back'].x + 20, self.touch_areas['wifi_list_back'].y + 10))
+        surface.blit(back_text, (self.touch_areas['wifi_list_back'].x + 20, self.touch_areas['wifi_list_back'].y + 10))
 
         title_text = self.font_medium.render("Select a WiFi Network", True, self.colors['accent'])
-        self.screen.blit(title_text, (self.width // 2 - title_text.get_width() // 2, self.layout['card_margin']))
+        surface.blit(title_text, (self.width // 2 - title_text.get_width() // 2, self.layout['card_margin']))
 
         if not self.wifi_scan_result:
             info_text = self.font_medium.render("Scanning for WiFi...", True, self.colors['text_dim'])
-            self.screen.blit(info_text, (self.width // 2 - info_text.get_width() // 2, self.height // 2 - info_text.get_height() // 2))
-            return
+            surface.blit(info_text, (self.width // 2 - info_text.get_width() // 2, self.height // 2 - self._font_medium_h // 2))
+            return surface
 
         # --- Pagination Logic ---
-        footer_height = int(self.height * 0.12)
+        footer_height = self.layout['footer_height']
         list_y_start = self.layout['header_height']
         list_height = self.height - list_y_start - footer_height - self.layout['card_margin']
         list_area_rect = pygame.Rect(self.layout['card_margin'], list_y_start, self.width - self.layout['card_margin']*2, list_height)
 
-        item_height = self.font_small.get_height() + self.layout['card_padding'] * 3
+        item_height = self._font_small_h + self.layout['card_padding'] * 3
         item_spacing = self.layout['card_margin']
         items_per_page = max(1, list_height // (item_height + item_spacing))
         total_pages = (len(self.wifi_scan_result) + items_per_page - 1) // items_per_page
@@ -467,46 +697,47 @@ class RPiProductInterface:
                 connect_button_height
             )
             
-            pygame.draw.rect(self.screen, self.colors['card'], item_rect_on_screen, border_radius=5)
+            pygame.draw.rect(surface, self.colors['card'], item_rect_on_screen, border_radius=5)
             
             # Draw SSID text
             ssid_text = self.font_small.render(ssid, True, self.colors['text'])
-            self.screen.blit(ssid_text, (item_rect_on_screen.x + self.layout['card_padding'], item_rect_on_screen.y + (item_height - ssid_text.get_height()) // 2))
+            surface.blit(ssid_text, (item_rect_on_screen.x + self.layout['card_padding'], item_rect_on_screen.y + (item_height - self._font_small_h) // 2))
 
             # Draw Connect button
-            pygame.draw.rect(self.screen, self.colors['accent'], connect_button_rect, border_radius=5)
+            pygame.draw.rect(surface, self.colors['accent'], connect_button_rect, border_radius=5)
             connect_text = self.font_small.render("Connect", True, self.colors['text'])
-            self.screen.blit(connect_text, (connect_button_rect.centerx - connect_text.get_width() // 2, connect_button_rect.centery - connect_text.get_height() // 2))
+            surface.blit(connect_text, (connect_button_rect.centerx - connect_text.get_width() // 2, connect_button_rect.centery - self._font_small_h // 2))
             
             self.touch_areas['wifi_items'].append({'ssid': ssid, 'rect': item_rect_on_screen, 'connect_rect': connect_button_rect})
             y_pos += item_height + item_spacing
 
         # --- Draw Footer with Page Buttons ---
         footer_y = self.height - footer_height
-        button_width = int(self.width * 0.2)
-        button_height = int(footer_height * 0.7)
+        button_width = self.layout['footer_button_width']
+        button_height = self.layout['footer_button_height']
         
         # Previous Page Button
         if self.wifi_list_page > 0:
             prev_rect = pygame.Rect(self.layout['card_margin'], footer_y + (footer_height - button_height) // 2, button_width, button_height)
             self.touch_areas['wifi_page_prev'] = prev_rect
-            pygame.draw.rect(self.screen, self.colors['accent'], prev_rect, border_radius=5)
+            pygame.draw.rect(surface, self.colors['accent'], prev_rect, border_radius=5)
             prev_text = self.font_small.render("Prev", True, self.colors['text'])
-            self.screen.blit(prev_text, (prev_rect.centerx - prev_text.get_width() // 2, prev_rect.centery - prev_text.get_height() // 2))
+            surface.blit(prev_text, (prev_rect.centerx - prev_text.get_width() // 2, prev_rect.centery - self._font_small_h // 2))
 
         # Page Indicator
         page_indicator_text = f"Page {self.wifi_list_page + 1} / {total_pages}"
         page_text = self.font_small.render(page_indicator_text, True, self.colors['text_dim'])
-        self.screen.blit(page_text, (self.width // 2 - page_text.get_width() // 2, footer_y + (footer_height - page_text.get_height()) // 2))
+        surface.blit(page_text, (self.width // 2 - page_text.get_width() // 2, footer_y + (footer_height - self._font_small_h) // 2))
 
         # Next Page Button
         if self.wifi_list_page < total_pages - 1:
             next_rect = pygame.Rect(self.width - self.layout['card_margin'] - button_width, footer_y + (footer_height - button_height) // 2, button_width, button_height)
             self.touch_areas['wifi_page_next'] = next_rect
-            pygame.draw.rect(self.screen, self.colors['accent'], next_rect, border_radius=5)
+            pygame.draw.rect(surface, self.colors['accent'], next_rect, border_radius=5)
             next_text = self.font_small.render("Next", True, self.colors['text'])
-            self.screen.blit(next_text, (next_rect.centerx - next_text.get_width() // 2, next_rect.centery - next_text.get_height() // 2))
+            surface.blit(next_text, (next_rect.centerx - next_text.get_width() // 2, next_rect.centery - self._font_small_h // 2))
 
+        return surface
 
     def draw_password_input_view(self):
         """Draws the on-screen keyboard for password input."""
@@ -514,10 +745,10 @@ class RPiProductInterface:
 
         # Back button
         pygame.draw.rect(self.screen, self.colors['error'], self.touch_areas['password_back'], border_radius=5)
-        back_text = self.font_small.render("Back", True, self.colors['text'])
+        back_text = self._cached_render(self.font_small, "Back", self.colors['text'])
         self.screen.blit(back_text, (self.touch_areas['password_back'].x + 20, self.touch_areas['password_back'].y + 10))
 
-        title_text = self.font_medium.render(f"Password for {self.selected_ssid}", True, self.colors['accent'])
+        title_text = self._cached_render(self.font_medium, f"Password for {self.selected_ssid}", self.colors['accent'])
         self.screen.blit(title_text, (self.width // 2 - title_text.get_width() // 2, self.layout['card_margin']))
 
         # Password display box
@@ -535,8 +766,8 @@ class RPiProductInterface:
             "asdfghjkl",
             "zxcvbnm"
         ]
-        key_size = int(self.width * 0.08)
-        key_margin = int(self.width * 0.01)
+        key_size = self.layout['key_size']
+        key_margin = self.layout['key_margin']
         keyboard_y_start = input_box_y + 60
 
         self.touch_areas['keyboard_keys'] = []
@@ -547,8 +778,8 @@ class RPiProductInterface:
                 key_rect = pygame.Rect(x, y, key_size, key_size)
                 self.touch_areas['keyboard_keys'].append({'char': char, 'rect': key_rect})
                 pygame.draw.rect(self.screen, self.colors['card'], key_rect, border_radius=5)
-                char_text = self.font_small.render(char, True, self.colors['text'])
-                self.screen.blit(char_text, (key_rect.centerx - char_text.get_width()//2, key_rect.centery - char_text.get_height()//2))
+                char_text = self._cached_render(self.font_small, char, self.colors['text'])
+                self.screen.blit(char_text, (key_rect.centerx - char_text.get_width()//2, key_rect.centery - self._font_small_h//2))
                 x += key_size + key_margin
             y += key_size + key_margin
 
@@ -556,14 +787,37 @@ class RPiProductInterface:
         backspace_rect = pygame.Rect(self.width - key_size*2 - key_margin*2, keyboard_y_start + (key_size + key_margin) * 2, key_size*2, key_size)
         self.touch_areas['keyboard_keys'].append({'char': 'backspace', 'rect': backspace_rect})
         pygame.draw.rect(self.screen, self.colors['warning'], backspace_rect, border_radius=5)
-        backspace_text = self.font_small.render("<-", True, self.colors['text'])
-        self.screen.blit(backspace_text, (backspace_rect.centerx - backspace_text.get_width()//2, backspace_rect.centery - backspace_text.get_height()//2))
+        backspace_text = self._cached_render(self.font_small, "<-", self.colors['text'])
+        self.screen.blit(backspace_text, (backspace_rect.centerx - backspace_text.get_width()//2, backspace_rect.centery - self._font_small_h//2))
 
         connect_rect = pygame.Rect(self.width - key_size*2 - key_margin*2, keyboard_y_start + (key_size + key_margin) * 3, key_size*2, key_size)
         self.touch_areas['password_connect'] = connect_rect
         pygame.draw.rect(self.screen, self.colors['success'], connect_rect, border_radius=5)
-        connect_text = self.font_small.render("Connect", True, self.colors['text'])
-        self.screen.blit(connect_text, (connect_rect.centerx - connect_text.get_width()//2, connect_rect.centery - connect_text.get_height()//2))
+        connect_text = self._cached_render(self.font_small, "Connect", self.colors['text'])
+        self.screen.blit(connect_text, (connect_rect.centerx - connect_text.get_width()//2, connect_rect.centery - self._font_small_h//2))
+
+    def _wpa_cli_responding(self):
+        """Returns True if wpa_supplicant answers a wpa_cli ping on wlan0."""
+        try:
+            result = subprocess.run(['sudo', 'wpa_cli', '-i', 'wlan0', 'ping'], capture_output=True, text=True, timeout=1)
+            return 'PONG' in result.stdout
+        except (subprocess.SubprocessError, OSError):
+            return False
+
+    def _wpa_conf_verified(self, wpa_conf_path):
+        """Returns True if wpa_supplicant.conf was verified and not modified since."""
+        try:
+            return WPA_CONF_SENTINEL.stat().st_mtime > os.stat(wpa_conf_path).st_mtime
+        except OSError:
+            return False
+
+    def _mark_wpa_conf_verified(self):
+        """Records that wpa_supplicant.conf currently allows updates via wpa_cli."""
+        try:
+            WPA_CONF_SENTINEL.parent.mkdir(parents=True, exist_ok=True)
+            WPA_CONF_SENTINEL.touch()
+        except OSError as e:
+            print(f"Warning: Could not write {WPA_CONF_SENTINEL}: {e}")
 
     def connect_to_wifi(self):
         """Attempts to connect to the selected WiFi network."""
@@ -573,34 +827,40 @@ class RPiProductInterface:
 
         def run_connection_logic():
             try:
-                # Restart the wpa_supplicant service to ensure it's in a clean state.
-                # This can resolve issues where wpa_cli fails to communicate with the service.
-                print("Restarting wpa_supplicant service...")
-                subprocess.run(['sudo', 'systemctl', 'restart', 'wpa_supplicant.service'], check=True)
-                time.sleep(2) # Give the service a moment to restart
+                # Restart the wpa_supplicant service only if wpa_cli fails to communicate with it.
+                # The restart plus settle time adds 2+ seconds, so skip it when the service is healthy.
+                if not self._wpa_cli_responding():
+                    print("wpa_supplicant not responding. Restarting wpa_supplicant service...")
+                    subprocess.run(['sudo', 'systemctl', 'restart', 'wpa_supplicant.service'], check=True)
+                    time.sleep(2) # Give the service a moment to restart
 
                 # Ensure wpa_supplicant.conf allows updates via wpa_cli
                 wpa_conf_dir = "/etc/wpa_supplicant"
                 wpa_conf_path = os.path.join(wpa_conf_dir, "wpa_supplicant.conf")
                 
-                try:
-                    # Check if the file exists. If not, create it with the required content.
-                    if not os.path.exists(wpa_conf_path):
-                        print(f"'{wpa_conf_path}' does not exist. Creating it.")
-                        # Ensure the directory exists
-                        subprocess.run(f'sudo mkdir -p {wpa_conf_dir}', shell=True, check=True)
-                        # Create the file with initial config
-                        initial_config = 'ctrl_interface=DIR=/var/run/wpa_supplicant GROUP=netdev\nupdate_config=1\n'
-                        subprocess.run(f"echo '{initial_config}' | sudo tee {wpa_conf_path} > /dev/null", shell=True, check=True)
-                    else:
-                        # If file exists, ensure update_config=1 is present
-                        conf_content = subprocess.check_output(['sudo', 'cat', wpa_conf_path], text=True)
-                        if 'update_config=1' not in conf_content:
-                            print(f"'{wpa_conf_path}' is missing 'update_config=1'. Adding it.")
-                            subprocess.run(f"echo 'update_config=1' | sudo tee -a {wpa_conf_path} > /dev/null", shell=True, check=True)
-                    subprocess.check_call(['sudo', 'wpa_cli', '-i', 'wlan0', 'reconfigure'])
-                except (subprocess.CalledProcessError, FileNotFoundError) as e:
-                    print(f"Warning: Could not create or update {wpa_conf_path}: {e}")
+                if self._wpa_conf_verified(wpa_conf_path):
+                    # Skip the sudo round-trips when the config was already verified and hasn't changed since
+                    print(f"'{wpa_conf_path}' already verified, skipping config check.")
+                else:
+                    try:
+                        # Check if the file exists. If not, create it with the required content.
+                        if not os.path.exists(wpa_conf_path):
+                            print(f"'{wpa_conf_path}' does not exist. Creating it.")
+                            # Ensure the directory exists
+                            subprocess.run(f'sudo mkdir -p {wpa_conf_dir}', shell=True, check=True)
+                            # Create the file with initial config
+                            initial_config = 'ctrl_interface=DIR=/var/run/wpa_supplicant GROUP=netdev\nupdate_config=1\n'
+                            subprocess.run(f"echo '{initial_config}' | sudo tee {wpa_conf_path} > /dev/null", shell=True, check=True)
+                        else:
+                            # If file exists, ensure update_config=1 is present
+                            conf_content = subprocess.check_output(['sudo', 'cat', wpa_conf_path], text=True)
+                            if 'update_config=1' not in conf_content:
+                                print(f"'{wpa_conf_path}' is missing 'update_config=1'. Adding it.")
+                                subprocess.run(f"echo 'update_config=1' | sudo tee -a {wpa_conf_path} > /dev/null", shell=True, check=True)
+                        subprocess.check_call(['sudo', 'wpa_cli', '-i', 'wlan0', 'reconfigure'])
+                        self._mark_wpa_conf_verified()
+                    except (subprocess.CalledProcessError, FileNotFoundError) as e:
+                        print(f"Warning: Could not create or update {wpa_conf_path}: {e}")
 
                 # Use wpa_cli for a more robust connection method
                 # 1. Add a new network configuration
@@ -617,6 +877,8 @@ class RPiProductInterface:
                 # 3. Enable the network and save the configuration
                 subprocess.check_call(['sudo', 'wpa_cli', '-i', 'wlan0', 'enable_network', network_id])
                 subprocess.check_call(['sudo', 'wpa_cli', '-i', 'wlan0', 'save_config'])
+                # save_config rewrites the file (keeping update_config=1), so refresh the sentinel's mtime
+                self._mark_wpa_conf_verified()
 
                 self.sd_copy_manager.status_message = "Connecting..."
 
@@ -636,6 +898,8 @@ class RPiProductInterface:
 
             except (subprocess.CalledProcessError, ValueError) as e:
                 print(f"Error connecting to WiFi: {e}")
+                if isinstance(e, subprocess.CalledProcessError):
+                    WPA_CONF_SENTINEL.unlink(missing_ok=True)
                 self.sd_copy_manager.status_message = "Error during connection."
             except Exception as e:
                 print(f"An unexpected error occurred: {e}")
@@ -647,33 +911,89 @@ class RPiProductInterface:
         threading.Thread(target=run_connection_logic, daemon=True).start()
 
 
-    def draw_status_bar(self):
+    def draw_main_view(self):
+        """Repaints the main view sections whose data changed since they were last drawn into
+        self.ui_layer and copies them to the screen. Returns the list of screen rects that changed."""
+        # One consistent copy of the collected data is used for the whole frame
+        data = self.data_collector.get_snapshot()
+        copy_status = self.copy_status_data
+        # Read the clock once; the header's dirty check and its clock text use the same second
+        now = time.time()
+        section_state = {
+            'header': (int(now), data['system_info'], data['battery_info']),
+            'network': (data['ip_address'], data['wifi_ssid'], data['connection_status'], self.qrcode_surface),
+            'usb': data['usb_devices'],
+            'progress': copy_status,
+            'status': data['last_update'],
+        }
+
+        bg = self.colors['bg']
+        dirty_rects = []
+        for name, rect in self.section_rects.items():
+            state = section_state[name]
+            if name in self._section_state and self._section_state[name] == state:
+                continue
+            self._section_state[name] = state
+
+            # Clip to the band so a card that overhangs it cannot paint over a neighbouring section
+            self.ui_layer.set_clip(rect)
+            # The card covers the rest of the band
+            for gap in self.section_gaps[name]:
+                self.ui_layer.fill(bg, gap)
+            if name == 'header':
+                self.draw_header(data, now)
+            elif name == 'network':
+                self.draw_network_card(data)
+            elif name == 'usb':
+                self.draw_usb_card(data)
+            elif name == 'progress':
+                self.draw_progress_bar_card(copy_status)
+            else:
+                self.draw_status_bar(data)
+            dirty_rects.append(rect)
+        self.ui_layer.set_clip(None)
+
+        # Copy only the repainted bands to the display
+        self.screen.blits([(self.ui_layer, rect, rect) for rect in dirty_rects], doreturn=False)
+        return dirty_rects
+
+    def draw_status_bar(self, data):
         """Draws the bottom status bar with update time and running status"""
-        status_bar_height = int(self.height * 0.08)
-        y_start = self.height - status_bar_height
-        status_rect = pygame.Rect(0, y_start, self.width, status_bar_height)
-        pygame.draw.rect(self.screen, self.colors['card'], status_rect)
+        colors = self.colors
+        status_rect = self.geom['status_bar_rect']
+        status_bar_height = status_rect.height
+        y_start = status_rect.y
+        pygame.draw.rect(self.ui_layer, colors['card'], status_rect)
 
         # Update Time
-        update_time = datetime.fromtimestamp(self.data_collector.data['last_update']).strftime("%H:%M:%S")
-        update_text = self.font_small.render(f"Updated: {update_time}", True, self.colors['text_dim'])
-        self.screen.blit(update_text, (self.layout['card_margin'], y_start + (status_bar_height - update_text.get_height()) // 2))
+        # Only re-format when the collector has published a new update
+        last_update = data['last_update']
+        if last_update != self._last_update_shown:
+            self._last_update_shown = last_update
+            update_time = datetime.fromtimestamp(last_update).strftime("%H:%M:%S")
+            self._update_time_surf = self.font_small.render(f"Updated: {update_time}", True, colors['text_dim']).convert_alpha()
+        self.ui_layer.blit(self._update_time_surf, (self.layout['card_margin'], y_start + (status_bar_height - self._font_small_h) // 2))
 
         # Running status indicator
-        status_color = self.colors['success']
-        pygame.draw.circle(self.screen, status_color, (self.width - self.layout['card_margin'] - int(status_bar_height * 0.35),
+        status_color = colors['success']
+        pygame.draw.circle(self.ui_layer, status_color, (self.width - self.layout['card_margin'] - self.layout['status_circle_offset'],
                                                         y_start + status_bar_height // 2),
-                                                       int(status_bar_height * 0.2))
+                                                       self.layout['status_circle_radius'])
 
     def handle_touch(self, pos):
         """Handles touch events"""
         if self.debug_mode:
             if self.touch_areas['refresh'].collidepoint(pos):
-                print("Manually updating data...")
-                threading.Thread(target=self.update_all_data, daemon=True).start()
+                self.request_data_refresh()
             elif self.touch_areas['restart'].collidepoint(pos):
-                print("Restarting system...")
-                subprocess.run(['sudo', 'reboot'])
+                if not self._reboot_pending:
+                    self._reboot_pending = True
+                    print("Restarting system...")
+                    # Don't block the UI thread while the system goes down. The command gets its own
+                    # session so it isn't taken down with us, and the main loop exits so the display
+                    # and any running copy are shut down cleanly first.
+                    subprocess.Popen(['sudo', 'reboot'], start_new_session=True)
+                    self.running = False
         
         if self.current_view == 'main':
             if self.touch_areas['change_wifi'].collidepoint(pos):
@@ -682,7 +1002,7 @@ class RPiProductInterface:
                 self.wifi_list_page = 0 # Reset page on view change
                 self.wifi_scan_result = [] # Clear previous results
                 # Scan in a new thread to avoid freezing the UI
-                threading.Thread(target=lambda: setattr(self, 'wifi_scan_result', self.data_collector.get_available_wifi_networks()), daemon=True).start()
+                threading.Thread(target=self._scan_wifi_networks, daemon=True).start()
 
         elif self.current_view == 'wifi_list':
             if self.touch_areas['wifi_list_back'].collidepoint(pos):
@@ -722,6 +1042,8 @@ class RPiProductInterface:
     def run(self):
         """Main execution loop"""
         clock = pygame.time.Clock()
+        drawn_view = None
+        drawn_view_state = None
 
         print("✓ Product interface started.")
         print(f"Display method: {self.display_manager.display_method}")
@@ -729,46 +1051,56 @@ class RPiProductInterface:
 
         try:
             while self.running:
-                for event in pygame.event.get():
+                # Sleep on the SDL event queue until input arrives, a worker thread posts
+                # UI_WAKE_EVENT, or the header clock is due to change
+                timeout = 1000 - int(time.time() * 1000) % 1000
+                event = pygame.event.wait(timeout)
+                events = [event] if event.type != pygame.NOEVENT else []
+                events.extend(pygame.event.get())
+                for event in events:
                     if event.type == pygame.QUIT:
                         self.running = False
                     elif event.type == pygame.KEYDOWN:
                         if event.key == pygame.K_ESCAPE:
                             self.running = False
                         elif event.key == pygame.K_F5:
-                            self.update_all_data()
+                            self.request_data_refresh()
+                    elif event.type == COPY_STATUS_EVENT:
+                        self.copy_status_data = event.status
                     elif event.type == pygame.MOUSEBUTTONDOWN:
                         self.handle_touch(event.pos)
                     elif event.type == pygame.FINGERDOWN:
                         touch_pos = (int(event.x * self.width), int(event.y * self.height))
                         self.handle_touch(touch_pos)
-                    elif event.type == pygame.FINGERUP:
-                        pass # FINGERUP is now only for ending a drag, which we removed.
 
                 # View-based rendering
+                view_changed = self.current_view != drawn_view
+                drawn_view = self.current_view
+
                 if self.current_view == 'main':
-                    self.screen.fill(self.colors['bg'])
-                    self.draw_header()
-                    
-                    # Draw network card first, and get its bottom Y for subsequent elements
-                    network_card_bottom_y = self.draw_network_card() 
-                    
-                    # Calculate USB card's y_start based on network card's bottom
-                    usb_card_y_start = network_card_bottom_y + self.layout['card_margin']
-                    # Draw USB card and get its bottom Y
-                    usb_card_bottom_y = self.draw_usb_card(usb_card_y_start) 
-                    
-                    # Calculate progress bar's y_start based on USB card's bottom
-                    progress_bar_y_start = usb_card_bottom_y + self.layout['card_margin']
-                    self.draw_progress_bar_card(progress_bar_y_start)
-                    
-                    self.draw_status_bar()
-                elif self.current_view == 'wifi_list':
-                    self.draw_wifi_list_view()
-                elif self.current_view == 'password_input':
-                    self.draw_password_input_view()
-
-                pygame.display.flip()
+                    dirty_rects = self.draw_main_view()
+                    if view_changed:
+                        # The other views drew over the screen; the main view is still intact in
+                        # ui_layer, so restore it with one copy instead of redrawing every card
+                        self.screen.blit(self.ui_layer, (0, 0))
+                        pygame.display.flip()
+                    elif dirty_rects:
+                        pygame.display.update(dirty_rects)
+                else:
+                    # These views only change through touches or a finished scan; redraw them then
+                    if self.current_view == 'wifi_list':
+                        view_state = (self.wifi_list_page, self.wifi_scan_result)
+                    else:
+                        view_state = (self.selected_ssid, self.password_input)
+                    if view_changed or view_state != drawn_view_state:
+                        drawn_view_state = view_state
+                        if self.current_view == 'wifi_list':
+                            self.draw_wifi_list_view()
+                        elif self.current_view == 'password_input':
+                            self.draw_password_input_view()
+                        pygame.display.flip()
+
+                # Caps the frame rate when events arrive in bursts; idle frames are paced by the wait above
                 clock.tick(30)
 
         except KeyboardInterrupt:
@@ -776,6 +1108,9 @@ class RPiProductInterface:
             self.running = False
         finally:
             self.running = False
+            # Wake the data thread so it sees running is False instead of finishing its wait
+            self._refresh_event.set()
+            self._qr_executor.shutdown(wait=False, cancel_futures=True)
             pygame.quit()
             if self.sd_copy_manager.is_copying:
                 self.sd_copy_manager.stop_copy()
\ No newline at end of file
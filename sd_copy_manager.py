@@ -1,12 +1,44 @@
 import os
+import errno
 import shutil
-import hashlib
+import stat
 import time
-from datetime import datetime
 import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import json
+import select
 import psutil # Used for checking mount points
 
+# Size of the first chunk compared against an existing destination file; most files that differ
+# are told apart here, before the rest is read in COPY_BUFFER_SIZE chunks
+HEAD_COMPARE_BYTES = 64 * 1024
+
+# Largest chunk requested per copy_file_range()/sendfile() call, and buffer size of the plain copy loop
+COPY_CHUNK_SIZE = 1 << 30
+COPY_BUFFER_SIZE = 1024 * 1024
+
+# copy_file_range()/sendfile() errors that only mean "not supported here"; anything else (ENOSPC, EIO) is a real failure
+COPY_FALLBACK_ERRNOS = {errno.EXDEV, errno.ENOSYS, errno.EOPNOTSUPP, errno.ENOTSUP, errno.EINVAL}
+
+# posix_fadvise hints for the streaming reads (None where posix_fadvise is unavailable)
+FADV_SEQUENTIAL = getattr(os, 'POSIX_FADV_SEQUENTIAL', None)
+FADV_DONTNEED = getattr(os, 'POSIX_FADV_DONTNEED', None)
+
+# Files copied in parallel, so reading the source, comparing and writing the SSD overlap
+COPY_WORKERS = 4
+
+# Timestamps within one slot of this many seconds always fall on the same local date: every UTC
+# offset (including DST) is a multiple of 15 minutes, so local midnight is always a slot boundary
+DATE_SLOT_SECONDS = 15 * 60
+
+# Minimum time (seconds) between per-file progress updates sent to the UI
+UI_PROGRESS_INTERVAL = 0.1
+
+# main_loop re-checks devices this often (seconds) while idle, when mount changes wake it directly
+MOUNT_RECHECK_INTERVAL = 60
+# ... and this often while a copy is running or when mount changes cannot be watched
+POLL_INTERVAL = 5
+
 class SDCopyManager:
     """
     Manages the file copying process from external USB storage devices to an SSD.
@@ -14,13 +46,14 @@ class SDCopyManager:
     and handles file duplicates and naming conflicts.
     """
     # Update the SSD mount point to your actual path
-    def __init__(self, ssd_mount_point="/mnt/backup_drive"):
+    def __init__(self, ssd_mount_point="/mnt/backup_drive", quick_check=True):
         self.ssd_mount_point = ssd_mount_point
+        self.quick_check = quick_check # Trust equal size + mtime; set False to always compare bytes
         self.active_usb_source_mount_point = None # Current USB source mount point being copied from
         self.is_copying = False
         self.current_file = ""
-        self.progress_percent = 0.0
         self.total_files = 0
+        self.processed_files = 0 # Copied, skipped and failed files of the current run
         self.copied_files = 0
         self.skipped_files = 0
         self.error_files = 0
@@ -28,7 +61,14 @@ class SDCopyManager:
         self.copy_thread = None
         self.event_callback = None # Callback function for UI updates
         self._last_ssd_status = None # Tracks the last detected status of the SSD (True/False)
+        self._writable_usb_devices = set() # (device, mountpoint) of mounted devices that passed the write test
+        self._usb_write_test_failed = False # A mounted candidate failed its last write test and is retried soon
         self._processed_usb_devices = set() # Tracks USB devices that have been processed/copied
+        self._dest_lock = threading.Lock() # Guards choosing destination file names across copy workers
+        self._claimed_dest_paths = set() # Destination paths a copy worker is currently writing
+        self._dest_dir_names = {} # Destination folder -> file names known to be taken there (per copy run)
+        self._date_bucket_cache = {} # Timestamp slot -> 'YYYY-MM-DD' (per copy run)
+        self._last_ui_update = 0.0 # time.monotonic() of the last update sent to the UI
 
         # Ensure the SSD mount point directory exists
         # This will create it if it doesn't exist, but it won't mount the drive.
@@ -36,14 +76,29 @@ class SDCopyManager:
         print(f"SDCopyManager initialized. SSD: {self.ssd_mount_point}")
         self._update_ui() # Update UI on initialization
 
+    @property
+    def progress_percent(self):
+        """Processed files as a percentage of the files found on the current source."""
+        if not self.total_files:
+            return 0.0
+        return 100.0 * self.processed_files / self.total_files
+
     def set_event_callback(self, callback):
         """Sets a callback function for sending updates to the UI during copying."""
         self.event_callback = callback
         self._update_ui() # Send initial status immediately after setting callback
 
-    def _update_ui(self):
-        """Invokes the callback function to update the UI"""
+    def _update_ui(self, progress_only=False):
+        """
+        Invokes the callback function to update the UI.
+        progress_only marks routine per-file progress updates; those are sent at most once per
+        UI_PROGRESS_INTERVAL, while status changes always go out immediately.
+        """
         if self.event_callback:
+            now = time.monotonic()
+            if progress_only and now - self._last_ui_update < UI_PROGRESS_INTERVAL:
+                return
+            self._last_ui_update = now
             status_data = {
                 'is_copying': self.is_copying,
                 'current_file': self.current_file,
@@ -53,76 +108,323 @@ class SDCopyManager:
                 'skipped_files': self.skipped_files,
                 'error_files': self.error_files,
                 'status_message': self.status_message,
-                'ssd_present': self.check_ssd_present(verbose=False),
+                # Reuse the last SSD check instead of running a write test on every update
+                'ssd_present': (self._last_ssd_status if self._last_ssd_status is not None
+                                else self.check_ssd_present(verbose=False)),
                 'active_usb_source': self.active_usb_source_mount_point
             }
             self.event_callback(status_data)
         
-    def _get_file_hash(self, filepath):
-        """Calculates the SHA256 hash of a file."""
-        hasher = hashlib.sha256()
-        try:
-            with open(filepath, 'rb') as f:
+    def _compare_or_copy(self, src_file_path, dest_file_path, partial_file_path):
+        """
+        Compares a source file with an existing destination file of the same size, in a single
+        pass over the source. Returns False if the contents are identical; nothing is written then.
+        At the first difference it starts writing the source to partial_file_path: the matching
+        prefix is taken from the destination (on the SSD) and the rest from the already open
+        source, so the source is never read twice. Returns True once partial_file_path holds a
+        full copy of the source.
+        """
+        chunk_size = HEAD_COMPARE_BYTES
+        offset = 0
+        with open(src_file_path, 'rb') as src, open(dest_file_path, 'rb') as dest:
+            self._fadvise(src.fileno(), FADV_SEQUENTIAL)
+            self._fadvise(dest.fileno(), FADV_SEQUENTIAL)
+            try:
                 while True:
-                    chunk = f.read(4096)
-                    if not chunk:
+                    src_chunk = src.read(chunk_size)
+                    if not src_chunk:
+                        return False
+                    if src_chunk != dest.read(len(src_chunk)):
                         break
-                    hasher.update(chunk)
-            return hasher.hexdigest()
-        except Exception as e:
-            print(f"Error calculating hash for {filepath}: {e}")
-            return None
-
-    def _get_file_creation_date(self, filepath):
-        """Attempts to get the file's creation date (or modification date as fallback)."""
+                    offset += len(src_chunk)
+                    chunk_size = COPY_BUFFER_SIZE
+
+                with open(partial_file_path, 'wb') as out:
+                    dest.seek(0)
+                    remaining = offset
+                    while remaining:
+                        data = dest.read(min(remaining, COPY_BUFFER_SIZE))
+                        if not data:
+                            raise OSError(f"{dest_file_path} changed during comparison")
+                        out.write(data)
+                        remaining -= len(data)
+                    out.write(src_chunk)
+                    shutil.copyfileobj(src, out, COPY_BUFFER_SIZE)
+            finally:
+                # Both files were read once; don't let them push everything else out of the page cache
+                self._fadvise(src.fileno(), FADV_DONTNEED)
+                self._fadvise(dest.fileno(), FADV_DONTNEED)
+        return True
+
+    def _iter_source_files(self, root):
+        """
+        Recursively yields (path, stat_result) for every non-hidden regular file under root.
+        Hidden folders (e.g. .Trashes, .Spotlight-V100, .fseventsd) are not entered at all.
+        Symlinks are not followed, and FIFOs, sockets and device nodes are skipped.
+        Each file is stat'ed once; the result is reused for bucketing and the quick check.
+        """
+        try:
+            with os.scandir(root) as it:
+                # Drop hidden entries by name, before anything else is done with them
+                entries = [entry for entry in it if not entry.name.startswith('.')]
+        except OSError as e:
+            print(f"Error scanning {root}: {e}")
+            return
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from self._iter_source_files(entry.path)
+                    continue
+                st = entry.stat(follow_symlinks=False)
+            except OSError as e:
+                print(f"Error reading {entry.path}: {e}")
+                continue
+            if stat.S_ISREG(st.st_mode):
+                yield entry.path, st
+
+    def _date_bucket(self, timestamp):
+        """Returns the local 'YYYY-MM-DD' date of a timestamp, formatting each time slot only once."""
+        slot = int(timestamp // DATE_SLOT_SECONDS)
+        bucket = self._date_bucket_cache.get(slot)
+        if bucket is None:
+            bucket = time.strftime('%Y-%m-%d', time.localtime(timestamp))
+            self._date_bucket_cache[slot] = bucket
+        return bucket
+
+    def _fast_copy(self, src_file_path, dest_file_path):
+        """
+        Copies file contents and metadata like shutil.copy2, but inside the kernel where possible.
+        Tries os.copy_file_range (reflink/server-side copy on filesystems that support it),
+        then os.sendfile, then a read/write loop with a 1 MiB buffer.
+        Removes the destination and raises OSError if the copy fails or comes up short.
+        """
+        try:
+            # O_NOATIME avoids an inode write per file on the source card; it needs file ownership
+            src_fd = os.open(src_file_path, os.O_RDONLY | getattr(os, 'O_NOATIME', 0))
+        except PermissionError:
+            src_fd = os.open(src_file_path, os.O_RDONLY)
+        self._fadvise(src_fd, FADV_SEQUENTIAL)
+        try:
+            src_size = os.fstat(src_fd).st_size
+            dest_fd = os.open(dest_file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+            try:
+                try:
+                    copied = None
+                    for method in (self._copy_fd_range, self._copy_fd_sendfile):
+                        try:
+                            copied = method(src_fd, dest_fd, src_size)
+                            break
+                        except (OSError, AttributeError) as e:
+                            if isinstance(e, OSError) and e.errno not in COPY_FALLBACK_ERRNOS:
+                                raise
+                            # Not supported here (old kernel, cross-filesystem, missing on this platform):
+                            # start over with the next method
+                            os.lseek(src_fd, 0, os.SEEK_SET)
+                            os.lseek(dest_fd, 0, os.SEEK_SET)
+                            os.ftruncate(dest_fd, 0)
+                    if copied is None:
+                        copied = self._copy_fd_buffered(src_fd, dest_fd)
+                finally:
+                    os.close(dest_fd)
+                if copied != src_size:
+                    raise OSError(errno.EIO, f"Copied {copied} of {src_size} bytes")
+            except Exception:
+                # Never leave a half-written file under its final name; the next run would keep it as the original
+                self._remove_partial(dest_file_path)
+                raise
+        finally:
+            # The source is read exactly once; drop it from the page cache
+            self._fadvise(src_fd, FADV_DONTNEED)
+            os.close(src_fd)
+        shutil.copystat(src_file_path, dest_file_path)
+
+    @staticmethod
+    def _fadvise(fd, advice):
+        """Passes an access pattern hint for the whole file to the kernel, where supported."""
+        if advice is None:
+            return
         try:
-            timestamp = os.stat(filepath).st_birthtime
-        except AttributeError:
-            # Fallback to modification time if creation time is not available (e.g., on some Linux file systems)
-            timestamp = os.stat(filepath).st_mtime
-        return datetime.fromtimestamp(timestamp).strftime('%Y-%m-%d')
+            os.posix_fadvise(fd, 0, 0, advice)
+        except OSError:
+            pass
 
-    def _copy_file(self, src_file_path, dest_dir):
+    @staticmethod
+    def _copy_fd_range(src_fd, dest_fd, src_size):
         """
-        Copies a single file, handling naming conflicts and content duplication.
+        Copies with os.copy_file_range until the end of the source file. Returns the bytes copied.
+        Some filesystems report 0 bytes instead of failing; that raises OSError so the next method is tried.
         """
-        filename = os.path.basename(src_file_path)
-        dest_file_path = os.path.join(dest_dir, filename)
-        
-        os.makedirs(dest_dir, exist_ok=True) # Ensure the destination directory exists
+        copied = 0
+        while True:
+            n = os.copy_file_range(src_fd, dest_fd, COPY_CHUNK_SIZE)
+            if not n:
+                break
+            copied += n
+        if copied == 0 and src_size:
+            raise OSError(errno.EOPNOTSUPP, "os.copy_file_range copied nothing")
+        return copied
 
-        if os.path.exists(dest_file_path):
-            src_hash = self._get_file_hash(src_file_path)
-            dest_hash = self._get_file_hash(dest_file_path)
+    @staticmethod
+    def _copy_fd_sendfile(src_fd, dest_fd, src_size):
+        """
+        Copies with os.sendfile until the end of the source file. Returns the bytes copied.
+        Some filesystems report 0 bytes instead of failing; that raises OSError so the next method is tried.
+        """
+        copied = 0
+        while True:
+            n = os.sendfile(dest_fd, src_fd, None, COPY_CHUNK_SIZE)
+            if not n:
+                break
+            copied += n
+        if copied == 0 and src_size:
+            raise OSError(errno.EOPNOTSUPP, "os.sendfile copied nothing")
+        return copied
+
+    @staticmethod
+    def _copy_fd_buffered(src_fd, dest_fd):
+        """Copies through a reused userspace buffer. Returns the bytes copied."""
+        buf = memoryview(bytearray(COPY_BUFFER_SIZE))
+        copied = 0
+        with open(src_fd, 'rb', buffering=0, closefd=False) as src:
+            while True:
+                n = src.readinto(buf)
+                if not n:
+                    break
+                copied += n
+                view = buf[:n]
+                while view:
+                    view = view[os.write(dest_fd, view):]
+        return copied
 
-            if src_hash == dest_hash:
+    def _copy_file(self, src_file_path, src_stat, dest_dir):
+        """
+        Copies a single file, handling naming conflicts and content duplication.
+        Safe to call from several copy workers at once. Returns 'copied', 'skipped' or 'error'.
+        """
+        filename = os.path.basename(src_file_path)
+        dest_file_path = os.path.join(dest_dir, filename) # dest_dir is created before the copy starts
+
+        with self._dest_lock:
+            # A path claimed by another worker may still be half written, so never compare against it
+            name_taken = dest_file_path in self._claimed_dest_paths
+            dest_exists = not name_taken and os.path.exists(dest_file_path)
+            if not name_taken and not dest_exists:
+                self._claimed_dest_paths.add(dest_file_path)
+                self._taken_dest_names(dest_dir).add(filename)
+
+        partial_file_path = None
+        if dest_exists:
+            try:
+                dest_stat = os.stat(dest_file_path)
+                same_size = src_stat.st_size == dest_stat.st_size
+            except OSError as e:
+                print(f"Error reading size of {dest_file_path}: {e}")
+                same_size = False
+            # rsync-style quick check: copies keep their mtime, so equal size and mtime means a
+            # re-import of a file that is already backed up. The 2 s slack covers FAT timestamps.
+            if same_size and self.quick_check and abs(src_stat.st_mtime - dest_stat.st_mtime) <= 2:
                 print(f"Skipping identical file: {filename}")
-                self.skipped_files += 1
-                return
-            else:
-                base, ext = os.path.splitext(filename)
-                count = 1
-                new_dest_file_path = dest_file_path
-                while os.path.exists(new_dest_file_path):
+                return 'skipped'
+            if same_size:
+                # Hidden, and unique per worker, until it is renamed to its final name below
+                partial_file_path = os.path.join(dest_dir, f".{filename}.{threading.get_ident()}.partial")
+                try:
+                    if not self._compare_or_copy(src_file_path, dest_file_path, partial_file_path):
+                        print(f"Skipping identical file: {filename}")
+                        return 'skipped'
+                except Exception as e:
+                    print(f"Error comparing {src_file_path} with {dest_file_path}: {e}")
+                    self._remove_partial(partial_file_path)
+                    return 'error'
+
+        if name_taken or dest_exists:
+            base, ext = os.path.splitext(filename)
+            count = 1
+            with self._dest_lock:
+                taken_names = self._taken_dest_names(dest_dir)
+                taken_names.add(filename)
+                new_filename = filename
+                # Known names are skipped in memory; the exists() check only confirms the first free-looking
+                # candidate, e.g. against a differently-cased name on a case-insensitive SSD
+                while new_filename in taken_names or os.path.exists(os.path.join(dest_dir, new_filename)):
+                    taken_names.add(new_filename)
                     new_filename = f"{base}_{count}{ext}"
-                    new_dest_file_path = os.path.join(dest_dir, new_filename)
                     count += 1
-                dest_file_path = new_dest_file_path
-                print(f"Renaming and copying different file: {filename} to {os.path.basename(dest_file_path)}")
+                taken_names.add(new_filename)
+                dest_file_path = os.path.join(dest_dir, new_filename)
+                self._claimed_dest_paths.add(dest_file_path)
+            print(f"Renaming and copying different file: {filename} to {os.path.basename(dest_file_path)}")
         try:
-            shutil.copy2(src_file_path, dest_file_path)
+            if partial_file_path:
+                # The comparison already wrote the copy
+                os.replace(partial_file_path, dest_file_path)
+                shutil.copystat(src_file_path, dest_file_path)
+            else:
+                self._fast_copy(src_file_path, dest_file_path)
             print(f"Copied: {src_file_path} to {dest_file_path}")
-            self.copied_files += 1
+            return 'copied'
         except Exception as e:
             print(f"Error copying {src_file_path} to {dest_file_path}: {e}")
-            self.error_files += 1
+            if partial_file_path:
+                self._remove_partial(partial_file_path)
+            return 'error'
+        finally:
+            # Once written (or failed) the file on disk speaks for itself
+            with self._dest_lock:
+                self._claimed_dest_paths.discard(dest_file_path)
+
+    @staticmethod
+    def _remove_partial(partial_file_path):
+        """Deletes a leftover partial copy, if there is one."""
+        try:
+            os.remove(partial_file_path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"Error removing {partial_file_path}: {e}")
+
+    def _taken_dest_names(self, dest_dir):
+        """
+        Returns the set of file names taken in dest_dir, listing the folder on first use in a copy run.
+        Callers hold _dest_lock.
+        """
+        names = self._dest_dir_names.get(dest_dir)
+        if names is None:
+            try:
+                names = set(os.listdir(dest_dir))
+            except OSError:
+                names = set()
+            self._dest_dir_names[dest_dir] = names
+        return names
+
+    def _copy_file_group(self, files):
+        """
+        Copies files that share a destination folder and file name, one after another, so each
+        one is compared against the copies made before it. Returns (src_file_path, result) pairs.
+        Stops early when the copy is cancelled.
+        """
+        results = []
+        for src_file_path, src_stat, dest_subdir in files:
+            if not self.is_copying:
+                break
+            try:
+                result = self._copy_file(src_file_path, src_stat, dest_subdir)
+            except Exception as e:
+                print(f"Error copying {src_file_path}: {e}")
+                result = 'error'
+            results.append((src_file_path, result))
+        return results
     
     def get_available_usb_source_devices(self):
         """
         Detects all external USB storage device mount points that are not the SSD.
         It excludes system partitions and the known SSD mount point.
+        A device that passes the write test is not tested again until it is unmounted; one that fails is
+        tested again on the next check, since permissions may still be settling right after automount.
         """
         usb_devices = []
+        writable_devices = set()
+        write_test_failed = False
         # Define common system mount point prefixes that we don't want to copy from
         system_mount_point_prefixes = ['/', '/boot', '/etc', '/dev', '/proc', '/sys', '/run', '/tmp', '/var']
 
@@ -152,28 +454,42 @@ class SDCopyManager:
             # 3. Broader check: any non-system, non-SSD mount point is a candidate.
             # We will verify writability to confirm it's a valid source.
             print(f"DEBUG: Candidate external device found: {mountpoint} ({device_name})")
-            if os.access(mountpoint, os.R_OK) and os.access(mountpoint, os.W_OK):
-                test_file = os.path.join(mountpoint, f".write_test_{os.getpid()}")
-                try:
-                    with open(test_file, 'w') as f:
-                        f.write("test")
-                    os.remove(test_file)
-                    usb_devices.append(mountpoint)
-                    print(f"Detected external USB source device: {mountpoint} ({device_name}) - writable")
-                except (IOError, OSError) as e:
-                    print(f"Warning: Candidate device {mountpoint} is not writable (read-only or permission error): {e}")
-                except Exception as e:
-                    print(f"Warning: An unexpected error occurred during write test for {mountpoint}: {e}")
-        
+            key = (device_name, mountpoint)
+            if key in self._writable_usb_devices or self._probe_usb_writable(mountpoint, device_name):
+                writable_devices.add(key)
+                usb_devices.append(mountpoint)
+            else:
+                write_test_failed = True
+
+        # Devices that are no longer mounted drop out here, so they are tested again when re-inserted
+        self._writable_usb_devices = writable_devices
+        self._usb_write_test_failed = write_test_failed
         print(f"DEBUG (get_available_usb_source_devices): Scan finished. Found USB devices: {usb_devices}")
         return usb_devices
 
+    @staticmethod
+    def _probe_usb_writable(mountpoint, device_name):
+        """Returns True if a temporary file can be written to and removed from the mount point."""
+        if not (os.access(mountpoint, os.R_OK) and os.access(mountpoint, os.W_OK)):
+            return False
+        test_file = os.path.join(mountpoint, f".write_test_{os.getpid()}")
+        try:
+            with open(test_file, 'w') as f:
+                f.write("test")
+            os.remove(test_file)
+            print(f"Detected external USB source device: {mountpoint} ({device_name}) - writable")
+            return True
+        except (IOError, OSError) as e:
+            print(f"Warning: Candidate device {mountpoint} is not writable (read-only or permission error): {e}")
+        except Exception as e:
+            print(f"Warning: An unexpected error occurred during write test for {mountpoint}: {e}")
+        return False
+
 
     def check_ssd_present(self, verbose=True):
         """
         Checks if the SSD is mounted and writable.
-        Uses psutil to verify the SSD mount point is a valid filesystem mount point,
-        and attempts to create a temporary file inside it to check write permissions.
+        Verifies the mount point with os.path.ismount, then writes a temporary file inside it to check write permissions.
         The verbose parameter controls whether detailed DEBUG messages are printed on each check.
         """
         current_status = False
@@ -185,18 +501,13 @@ class SDCopyManager:
             self._last_ssd_status = False
             return False
 
-        # 2. Then use psutil to check if it's actually a mount point
-        is_mounted = False
-        for partition in psutil.disk_partitions():
-            if partition.mountpoint == self.ssd_mount_point:
-                is_mounted = True
-                break
-        
-        if not is_mounted:
+        # 2. Then check if it's actually a mount point
+        if not os.path.ismount(self.ssd_mount_point):
             if verbose or self._last_ssd_status is not False:
-                print(f"ERROR: psutil does not identify '{self.ssd_mount_point}' as a valid mount point.")
-                print("List of detected mount points (for reference):")
+                print(f"ERROR: '{self.ssd_mount_point}' is not a mount point.")
                 if verbose:
+                    # psutil is only needed for this diagnostic listing
+                    print("List of detected mount points (for reference):")
                     for p in psutil.disk_partitions():
                         print(f"   Device: {p.device}, Mountpoint: {p.mountpoint}, FileSystem: {p.fstype}")
             self._last_ssd_status = False
@@ -250,18 +561,23 @@ class SDCopyManager:
         self.is_copying = True
         self.status_message = f"Scanning USB device: {self.active_usb_source_mount_point}..."
         self.total_files = 0
+        self.processed_files = 0
         self.copied_files = 0
         self.skipped_files = 0
         self.error_files = 0
-        self.progress_percent = 0.0
         self._update_ui()
 
-        files_to_copy = []
-        for root, _, files in os.walk(self.active_usb_source_mount_point):
-            for file in files:
-                file_path = os.path.join(root, file)
-                if not os.path.basename(file_path).startswith('.'):
-                    files_to_copy.append(file_path)
+        # Group files by their destination date folder while scanning, so each file is stat'ed once
+        files_by_dest_dir = {}
+        self._date_bucket_cache = {} # The local timezone may have changed since the last run
+        for file_path, file_stat in self._iter_source_files(self.active_usb_source_mount_point):
+            # Creation time where the platform provides it, otherwise the modification time
+            creation_date = self._date_bucket(getattr(file_stat, 'st_birthtime', file_stat.st_mtime))
+            dest_subdir = os.path.join(self.ssd_mount_point, creation_date)
+            files_by_dest_dir.setdefault(dest_subdir, []).append((file_path, file_stat))
+        files_to_copy = [(file_path, file_stat, dest_subdir)
+                         for dest_subdir, files in files_by_dest_dir.items()
+                         for file_path, file_stat in files]
         
         self.total_files = len(files_to_copy)
         if self.total_files == 0:
@@ -273,32 +589,63 @@ class SDCopyManager:
         self.status_message = "Copying files..."
         self._update_ui()
 
-        for i, src_file_path in enumerate(files_to_copy):
-            if not self.is_copying: # Check if copy was cancelled
-                self.status_message = "Copying cancelled."
-                break
-            
-            # Re-check SSD presence and writability before copying each file for robustness
-            if not self.check_ssd_present():
-                self.status_message = "SSD disconnected during copy! Copy aborted."
-                self.is_copying = False
-                self._update_ui()
-                break # Stop copying if SSD disconnects
-            
-            creation_date = self._get_file_creation_date(src_file_path)
-            dest_subdir = os.path.join(self.ssd_mount_point, creation_date)
-            
-            self.current_file = os.path.basename(src_file_path)
-            self._copy_file(src_file_path, dest_subdir)
-            
-            # Update progress percentage (processed files / total files)
-            self.progress_percent = ((self.copied_files + self.skipped_files + self.error_files) / self.total_files) * 100
-            self._update_ui()
+        # Create each date folder once up front instead of once per file
+        for dest_subdir in files_by_dest_dir:
+            try:
+                os.makedirs(dest_subdir, exist_ok=True)
+            except OSError as e:
+                print(f"Error creating destination folder {dest_subdir}: {e}")
+
+        # Files that would land on the same destination name are copied by one worker, in scan order
+        file_groups = {}
+        for src_file_path, src_stat, dest_subdir in files_to_copy:
+            key = (dest_subdir, os.path.basename(src_file_path))
+            file_groups.setdefault(key, []).append((src_file_path, src_stat, dest_subdir))
+
+        with self._dest_lock:
+            self._dest_dir_names = {} # Folders may have changed since the last run
+
+        # Workers only copy; counters, progress and UI updates stay on this thread
+        executor = ThreadPoolExecutor(max_workers=COPY_WORKERS)
+        try:
+            futures = [executor.submit(self._copy_file_group, files) for files in file_groups.values()]
+            for future in as_completed(futures):
+                had_error = False
+                for src_file_path, result in future.result():
+                    self.processed_files += 1
+                    if result == 'copied':
+                        self.copied_files += 1
+                    elif result == 'skipped':
+                        self.skipped_files += 1
+                    else:
+                        self.error_files += 1
+                        had_error = True
+                    self.current_file = os.path.basename(src_file_path)
+
+                self._update_ui(progress_only=True)
+
+                if not self.is_copying: # Check if copy was cancelled
+                    self.status_message = "Copying cancelled."
+                    break
+
+                # Cheap mount check between files; the full write test runs only after a failed copy
+                ssd_ok = os.path.ismount(self.ssd_mount_point)
+                if ssd_ok and had_error:
+                    ssd_ok = self.check_ssd_present()
+                elif not ssd_ok:
+                    self._last_ssd_status = False
+                if not ssd_ok:
+                    self.status_message = "SSD disconnected during copy! Copy aborted."
+                    self.is_copying = False
+                    self._update_ui()
+                    break # Stop copying if SSD disconnects
+        finally:
+            # Files not started yet are dropped; workers stop after their current file once is_copying is False
+            executor.shutdown(wait=True, cancel_futures=True)
 
         # Status update after copying is finished
         if self.is_copying: # Check if it completed normally (not cancelled)
             self.status_message = f"Copy complete! Copied: {self.copied_files}, Skipped: {self.skipped_files}, Errors: {self.error_files}"
-            self.progress_percent = 100.0
             # Add the successfully copied device to the processed set
             if self.active_usb_source_mount_point:
                 self._processed_usb_devices.add(self.active_usb_source_mount_point)
@@ -337,9 +684,37 @@ class SDCopyManager:
             print("USB device copy process requested to stop.")
             self._update_ui()
 
+    def _open_mount_watch(self):
+        """
+        Opens /proc/self/mounts for _wait_for_mount_change. The kernel flags it with POLLPRI
+        whenever a filesystem is mounted or unmounted. Returns None where that is unavailable.
+        """
+        if not hasattr(select, 'poll'):
+            return None
+        try:
+            mounts = open('/proc/self/mounts')
+        except OSError:
+            return None
+        poller = select.poll()
+        poller.register(mounts, select.POLLPRI | select.POLLERR)
+        return mounts, poller
+
+    def _wait_for_mount_change(self, mount_watch):
+        """Sleeps until the mount table changes or the next periodic re-check is due."""
+        if mount_watch is None:
+            time.sleep(POLL_INTERVAL)
+            return
+        # Keep polling regularly during a copy so the next device is picked up once it finishes,
+        # and while a freshly mounted device has not passed its write test yet
+        timeout = POLL_INTERVAL if self.is_copying or self._usb_write_test_failed else MOUNT_RECHECK_INTERVAL
+        _, poller = mount_watch
+        poller.poll(timeout * 1000)
+
     def main_loop(self):
         """Main loop for periodically checking USB devices and SSD and automatically starting copy."""
         last_usb_devices_present = False
+        # Opened before the first check so no mount change after it is missed
+        mount_watch = self._open_mount_watch()
         
         # Perform an initial detection at the start of the loop and set initial state
         current_usb_devices = self.get_available_usb_source_devices()
@@ -384,17 +759,17 @@ class SDCopyManager:
                 self._processed_usb_devices.clear() # Clear all processed USB devices
                 self.active_usb_source_mount_point = None
                 self.total_files = 0
+                self.processed_files = 0
                 self.copied_files = 0
                 self.skipped_files = 0
                 self.error_files = 0
-                self.progress_percent = 0.0
                 self.current_file = ""
             
             last_usb_devices_present = current_usb_devices_present
             
             self._update_ui() # Periodically update UI
 
-            time.sleep(5) # Check every 5 seconds
+            self._wait_for_mount_change(mount_watch) # Re-check when devices are mounted or unmounted
 
 if __name__ == '__main__':
     def ui_update_callback(data):